@@ -1,20 +1,56 @@
+import functools
+import json
 import logging
 import os
 from pathlib import Path
+
+import yaml
 from omegaconf import OmegaConf
 
 logger = logging.getLogger(__name__)
 project_path = Path(__file__).resolve().parents[1]
 
+# libyaml's C loader skips PyYAML's per-token Python dispatch (~10x faster
+# parse); fall back to the pure-Python loader when libyaml is unavailable.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 def load_config():
+    """Load config for the path in CONFIG_PATH, parsing each path only once."""
+    config_path = Path(os.getenv('CONFIG_PATH', project_path / 'config.yaml'))
+    return _load(str(config_path.resolve()))
+
+
+@functools.lru_cache(maxsize=None)
+def _load(config_path: str):
     try:
-        config_path = os.getenv('CONFIG_PATH', project_path / 'config.yaml')
-        config = OmegaConf.load(config_path)
-        logger.info(f"Configuration loaded successfully from {config_path}")
+        config_path = Path(config_path)
+        cache_path = config_path.with_suffix('.cache.json')
+
+        # json.load is an order of magnitude faster than a YAML parse, so a
+        # sidecar cache keeps YAML off the startup critical path. The cache is
+        # best-effort: any problem with it falls through to the YAML source.
+        try:
+            if (cache_path.exists()
+                    and cache_path.stat().st_mtime >= config_path.stat().st_mtime):
+                with open(cache_path, encoding="utf-8") as f:
+                    config = OmegaConf.create(json.load(f))
+                logger.info("Configuration loaded from cache %s", cache_path)
+                return config
+        except Exception as e:
+            logger.warning("Ignoring config cache %s: %s", cache_path, e)
+
+        with open(config_path, encoding="utf-8") as f:
+            config = OmegaConf.create(yaml.load(f, Loader=_YAML_LOADER))
+        try:
+            with open(cache_path, 'w', encoding="utf-8") as f:
+                json.dump(OmegaConf.to_container(config), f)
+        except Exception as e:
+            logger.warning("Failed to write config cache %s: %s", cache_path, e)
+        logger.info("Configuration loaded successfully from %s", config_path)
         return config
     except Exception as e:
-        logger.error(f"Failed to load config: {e}")
+        logger.error("Failed to load config: %s", e)
         raise
 
 
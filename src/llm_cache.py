@@ -0,0 +1,114 @@
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from llm_interface import LLMInterface
+
+if TYPE_CHECKING:
+    import litellm
+
+logger = logging.getLogger(__name__)
+
+
+class DiskResponseCache:
+    """Content-addressed LLM response cache persisted across runs.
+
+    Stores JSON-serializable payloads keyed by a blake2b digest of the
+    rendered request. Entries older than ttl seconds are evicted on read,
+    and any filesystem problem degrades to a cache miss.
+    """
+
+    def __init__(self,
+                 cache_dir: str | Path = ".llm_cache",
+                 ttl: float = 24 * 3600):
+        self._dir = Path(cache_dir)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+
+    @staticmethod
+    def key_for(payload: str) -> str:
+        """Digest a rendered request into a cache key"""
+        return hashlib.blake2b(
+            payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: str):
+        """Return the cached payload for key, or None on miss/expiry"""
+        path = self._dir / f"{key}.json"
+        try:
+            if time.time() - path.stat().st_mtime > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value) -> None:
+        """Store a JSON-serializable payload under key"""
+        try:
+            with open(self._dir / f"{key}.json", "w", encoding="utf-8") as f:
+                json.dump(value, f)
+        except OSError as e:
+            logger.warning("Failed to write LLM cache entry %s: %s", key, e)
+
+
+class CachedLLMInterface(LLMInterface):
+    """LLM interface with an exact-match response cache.
+
+    Deterministic requests (temperature 0 or unset, as used by the JSON
+    extractors) are served from an in-memory LRU keyed on a SHA256 of the
+    full call signature, skipping the network round-trip for repeated
+    identical prompts. Sampled requests (temperature > 0) always go to the
+    provider.
+    """
+
+    def __init__(self, *args, cache_size: int = 256, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cache: OrderedDict[str, "litellm.ModelResponse"] = OrderedDict()
+        self._cache_size = cache_size
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _cache_key(self,
+                   prompt: str | None,
+                   call_params: dict[str, str] | None,
+                   kwargs: dict) -> str | None:
+        """Build a deterministic cache key, or None if not cacheable"""
+        if kwargs.get("temperature") not in (None, 0):
+            return None
+        payload = json.dumps(
+            {
+                "model": self.model_name,
+                "prompt": prompt,
+                "call_params": call_params,
+                "kwargs": kwargs,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def send_request(self,
+                     call_params: dict[str, str] | None = None,
+                     prompt: str | None = None,
+                     **kwargs) -> "litellm.ModelResponse":
+        key = self._cache_key(prompt or self.prompt, call_params, kwargs)
+        if key is not None and key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats["hits"] += 1
+            logger.info("LLM cache hit (hits=%d, misses=%d)",
+                        self.stats["hits"], self.stats["misses"])
+            return self._cache[key]
+
+        response = super().send_request(
+            call_params=call_params, prompt=prompt, **kwargs)
+
+        if key is not None:
+            self.stats["misses"] += 1
+            self._cache[key] = response
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return response
@@ -1,10 +1,75 @@
 from abc import ABC, abstractmethod
+import asyncio
+import functools
 import json
 import logging
-import litellm
+import string
+from typing import TYPE_CHECKING
 from config import CONFIG
+
+if TYPE_CHECKING:
+    # Annotations only; runtime code goes through _get_litellm()
+    import litellm
+
+try:
+    # orjson parses large JSON payloads several times faster than stdlib json
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+_litellm = None
+
+
+def _get_litellm():
+    """Import litellm on first use.
+
+    The package drags in a large transitive import tree (pydantic schemas,
+    tokenizers, provider SDKs) that noticeably slows short-lived entrypoints
+    which never touch the LLM.
+    """
+    global _litellm
+    if _litellm is None:
+        import litellm
+        _litellm = litellm
+    return _litellm
+
+
+@functools.lru_cache(maxsize=64)
+def _compile(template: str) -> tuple:
+    """Pre-parse a template into (literal, field) segments, cached per template"""
+    return tuple(
+        (literal, field)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _render(template: str, params: dict) -> str:
+    """Substitute params into a pre-compiled template.
+
+    Equivalent to template.format(**params) for the plain {name} placeholders
+    the prompts use, but the template is only scanned once per process instead
+    of on every LLM call.
+    """
+    parts = []
+    for literal, field in _compile(template):
+        parts.append(literal)
+        if field is not None:
+            parts.append(str(params[field]))
+    return "".join(parts)
+
+
+def _system_message(system_prompt: str, cache_system_prompt: bool) -> dict:
+    """Build a system message, optionally marked for provider-side caching"""
+    if not cache_system_prompt:
+        return {"role": "system", "content": system_prompt}
+    return {"role": "system",
+            "content": [{"type": "text",
+                         "text": system_prompt,
+                         "cache_control": {"type": "ephemeral"}}]}
+
 
 class LLMInterface:
     """litellm-based LLM interface implementation"""
@@ -19,12 +84,105 @@ class LLMInterface:
         self.llm_api_key = llm_api_key
         self.llm_base_url = llm_base_url
         self.prompt = prompt
+        self._usage = {"prompt_tokens": 0,
+                       "completion_tokens": 0,
+                       "total_tokens": 0,
+                       "cache_creation_input_tokens": 0,
+                       "cache_read_input_tokens": 0}
+
+    def _track_usage(self, response) -> None:
+        """Accumulate token usage; only price the response when INFO is logged.
+
+        litellm.completion_cost re-walks pricing tables on every call, so the
+        cost lookup is skipped entirely when the log line would be dropped.
+        """
+        try:
+            usage = response["usage"] or {}
+        except (KeyError, TypeError):
+            usage = {}
+        for key in self._usage:
+            value = (usage.get(key) if isinstance(usage, dict)
+                     else getattr(usage, key, 0))
+            self._usage[key] += value or 0
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Total cost %s",
+                        _get_litellm().completion_cost(response))
+
+    def cost_report(self) -> dict:
+        """Token usage accumulated over all requests of this interface"""
+        return dict(self._usage)
 
     def send_request(self,
                      call_params: dict[str, str] | None = None,
                      prompt: str | None = None,
-                     **kwargs) -> litellm.ModelResponse:
+                     system_prompt: str | None = None,
+                     messages: list[dict] | None = None,
+                     cache_system_prompt: bool = False,
+                     **kwargs) -> "litellm.ModelResponse":
+        """
+        Parameters
+        ----------
+        call_params : dict[str, str] | None, optional
+            Parameters to format prompt variables,
+            if empty then set to {}, by default None
+        prompt : str | None, optional
+            Prompt to send, if empty then set to self.prompt, by default None
+        system_prompt : str | None, optional
+            Static instructions sent as a system message ahead of the user
+            prompt. Callers should keep it byte-identical across related
+            requests so providers can prefix-cache it, by default None
+        messages : list[dict] | None, optional
+            Pre-built conversation to send as-is; overrides prompt /
+            call_params / system_prompt, by default None
+        cache_system_prompt : bool, optional
+            Tag the system message with an Anthropic-style cache_control
+            marker. Only set this against providers that understand content
+            blocks; OpenAI-style endpoints cache stable prefixes
+            automatically, by default False
+
+        Returns
+        -------
+        litellm.ModelResponse
+        """
+        litellm = _get_litellm()
+        if messages is None:
+            if prompt is None:
+                prompt = self.prompt
+            if call_params is None:
+                call_params = {}
+            messages = [{"role": "user",
+                        "content": _render(prompt, call_params)}]
+            if system_prompt is not None:
+                messages.insert(
+                    0, _system_message(system_prompt, cache_system_prompt))
+        logger.info(
+            "Calling model with prompt (300 symbols):\n%s",
+            (prompt or messages[-1]["content"])[:300])
+        response = litellm.completion(
+            model=self.model_name,
+            messages=messages,
+            api_key=self.llm_api_key,
+            api_base=self.llm_base_url,
+            **kwargs
+        )
+        # logger.info(
+        #     "Got response for call_params %s (300 symbols):\n %s...",
+        #     str(call_params), response['choices'][0]['message']['content'][:300])
+        self._track_usage(response)
+        return response
+
+    async def send_request_async(self,
+                                 call_params: dict[str, str] | None = None,
+                                 prompt: str | None = None,
+                                 system_prompt: str | None = None,
+                                 cache_system_prompt: bool = False,
+                                 **kwargs) -> "litellm.ModelResponse":
         """
+        Async variant of send_request built on litellm.acompletion.
+
+        Lets callers overlap several LLM round-trips with asyncio.gather
+        instead of paying for them sequentially.
+
         Parameters
         ----------
         call_params : dict[str, str] | None, optional
@@ -32,36 +190,127 @@ class LLMInterface:
             if empty then set to {}, by default None
         prompt : str | None, optional
             Prompt to send, if empty then set to self.prompt, by default None
+        system_prompt : str | None, optional
+            Static instructions sent as a system message ahead of the user
+            prompt, kept byte-identical for prefix caching, by default None
+        cache_system_prompt : bool, optional
+            Tag the system message with an Anthropic-style cache_control
+            marker, by default False
 
         Returns
         -------
         litellm.ModelResponse
         """
+        litellm = _get_litellm()
         if prompt is None:
             prompt = self.prompt
         if call_params is None:
             call_params = {}
         messages = [{"role": "user",
-                    "content": prompt.format(**call_params)}]
+                    "content": _render(prompt, call_params)}]
+        if system_prompt is not None:
+            messages.insert(
+                0, _system_message(system_prompt, cache_system_prompt))
         logger.info(
-            "Calling model with prompt (300 symbols):\n%s", prompt[:300])
-        response = litellm.completion(
+            "Calling model async with prompt (300 symbols):\n%s", prompt[:300])
+        response = await litellm.acompletion(
             model=self.model_name,
             messages=messages,
             api_key=self.llm_api_key,
             api_base=self.llm_base_url,
             **kwargs
         )
-        # logger.info(
-        #     "Got response for call_params %s (300 symbols):\n %s...",
-        #     str(call_params), response['choices'][0]['message']['content'][:300])
-        logger.info("Total cost %s",  litellm.completion_cost(response))
+        self._track_usage(response)
         return response
 
+    async def send_request_stream(self,
+                                  call_params: dict[str, str] | None = None,
+                                  prompt: str | None = None,
+                                  system_prompt: str | None = None,
+                                  **kwargs):
+        """
+        Stream a completion, yielding content fragments as they arrive.
+
+        Lets callers start acting on early parts of a response (e.g. the
+        next_action block of an analysis) instead of waiting for the full
+        generation to finish.
+
+        Parameters
+        ----------
+        call_params : dict[str, str] | None, optional
+            Parameters to format prompt variables,
+            if empty then set to {}, by default None
+        prompt : str | None, optional
+            Prompt to send, if empty then set to self.prompt, by default None
+        system_prompt : str | None, optional
+            Static instructions sent as a system message ahead of the user
+            prompt, by default None
+
+        Yields
+        ------
+        str
+            Content fragments in generation order.
+        """
+        litellm = _get_litellm()
+        if prompt is None:
+            prompt = self.prompt
+        if call_params is None:
+            call_params = {}
+        messages = [{"role": "user",
+                    "content": _render(prompt, call_params)}]
+        if system_prompt is not None:
+            messages.insert(0, {"role": "system", "content": system_prompt})
+        logger.info(
+            "Streaming model call with prompt (300 symbols):\n%s",
+            prompt[:300])
+        stream = await litellm.acompletion(
+            model=self.model_name,
+            messages=messages,
+            api_key=self.llm_api_key,
+            api_base=self.llm_base_url,
+            stream=True,
+            **kwargs
+        )
+        async for chunk in stream:
+            delta = chunk["choices"][0]["delta"].get("content")
+            if delta:
+                yield delta
+
+    async def send_request_batch(self,
+                                 calls: list[dict],
+                                 max_concurrency: int = 5) -> list:
+        """
+        Dispatch several requests concurrently and collect the responses.
+
+        Amortizes connection overhead and lets the provider prefix-cache
+        any shared prompt portion across the batch.
+
+        Parameters
+        ----------
+        calls : list[dict]
+            One keyword-argument dict per request, as accepted by
+            send_request_async.
+        max_concurrency : int, optional
+            Upper bound on in-flight requests, by default 5
+
+        Returns
+        -------
+        list[litellm.ModelResponse]
+            Responses in the same order as calls.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(call: dict) -> "litellm.ModelResponse":
+            async with semaphore:
+                return await self.send_request_async(**call)
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
     @staticmethod
-    def get_response_content(response: litellm.ModelResponse) -> str | dict:
+    def get_response_content(response: "litellm.ModelResponse") -> str | dict:
         try:
             result = response['choices'][0]['message']['content']
-            return json.loads(result)
-        except json.JSONDecodeError:
+            return _loads(result)
+        except ValueError:
+            # covers both json.JSONDecodeError and orjson.JSONDecodeError
             return result
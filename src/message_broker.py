@@ -1,3 +1,4 @@
+import itertools
 import logging
 import json
 import uuid
@@ -7,6 +8,35 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Compact separators shave whitespace bytes off every payload on the wire
+_JSON_SEPARATORS = (",", ":")
+
+try:
+    # orjson encodes/decodes roughly an order of magnitude faster than
+    # stdlib json and produces bytes directly, skipping an encode pass
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=_JSON_SEPARATORS)
+    _loads = json.loads
+
+# One connection pool per Redis URL, shared by every broker instance so
+# reconnects and multiple brokers reuse established connections
+_POOLS: dict[str, redis.ConnectionPool] = {}
+
+
+def _get_pool(redis_url: str) -> redis.ConnectionPool:
+    pool = _POOLS.get(redis_url)
+    if pool is None:
+        # Bytes mode, explicitly: payloads go straight from the socket into
+        # json.loads with no per-message UTF-8 decode pass in the client
+        pool = redis.ConnectionPool.from_url(
+            redis_url, max_connections=32, decode_responses=False)
+        _POOLS[redis_url] = pool
+    return pool
+
 
 @dataclass
 class HumanRequest:
@@ -27,28 +57,41 @@ class MessageBroker:
         self._response_stream = "human_responses"
         self._consumer_group = "agent_group"
         self._consumer_name = str(uuid.uuid4())
+        # Request ids combine one random prefix per broker with a counter:
+        # unique across brokers, but O(1) with no OS RNG read per request
+        self._id_prefix = uuid.uuid4().hex[:8]
+        self._id_counter = itertools.count()
+        # Responses consumed from the stream but not yet claimed by their
+        # requesting caller, keyed by request_id
+        self._responses: dict[str, str] = {}
 
     async def initialize(self):
         """Initialize Redis connection and ensure streams exist"""
         logger.info("Initializing MessageBroker with Redis at %s",
                     self.redis_url)
-        self.redis_client = redis.from_url(self.redis_url)
+        self.redis_client = redis.Redis(
+            connection_pool=_get_pool(self.redis_url))
 
-        # Ensure consumer groups exist
-        for stream in [self._request_stream, self._response_stream]:
-            try:
-                await self.redis_client.xgroup_create(
-                    stream, self._consumer_group, mkstream=True)
-                logger.info("Created consumer group %s for stream %s",
-                            self._consumer_group, stream)
-            except redis.ResponseError as e:
-                if "BUSYGROUP" in str(e):
+        # Ensure consumer groups exist; one pipelined round trip instead of
+        # one per stream
+        streams = [self._request_stream, self._response_stream]
+        pipe = self.redis_client.pipeline(transaction=False)
+        for stream in streams:
+            pipe.xgroup_create(stream, self._consumer_group, mkstream=True)
+        results = await pipe.execute(raise_on_error=False)
+
+        for stream, result in zip(streams, results):
+            if isinstance(result, redis.ResponseError):
+                if "BUSYGROUP" in str(result):
                     logger.info(
                         "Consumer group %s already exists for stream %s",
                         self._consumer_group, stream
                     )
                 else:
-                    raise
+                    raise result
+            else:
+                logger.info("Created consumer group %s for stream %s",
+                            self._consumer_group, stream)
 
     async def send_request(
         self,
@@ -70,7 +113,7 @@ class MessageBroker:
         if not self.redis_client:
             raise RuntimeError("MessageBroker not initialized")
 
-        request_id = str(uuid.uuid4())
+        request_id = f"{self._id_prefix}-{next(self._id_counter)}"
         message = {
             "request_id": request_id,
             "scenario_id": scenario_id,
@@ -86,7 +129,7 @@ class MessageBroker:
         await self.redis_client.xadd(
             self._request_stream,
             {
-                "message": json.dumps(message)
+                "message": _dumps(message)
             }
         )
 
@@ -108,7 +151,7 @@ class MessageBroker:
         await self.redis_client.xadd(
             self._response_stream,
             {
-                "message": json.dumps(message)
+                "message": _dumps(message)
             }
         )
 
@@ -125,55 +168,65 @@ class MessageBroker:
         if not self.redis_client:
             raise RuntimeError("MessageBroker not initialized")
 
-        # Read all messages from response stream for this consumer
-        messages = await self.redis_client.xread(
-            {self._response_stream: "0-0"},
+        if request_id in self._responses:
+            logger.debug("Found buffered response for request %s", request_id)
+            return self._responses.pop(request_id)
+
+        # Consume only new messages via the consumer group instead of
+        # rescanning the whole stream from "0-0" on every poll; responses
+        # for other requests are buffered for their callers.
+        messages = await self.redis_client.xreadgroup(
+            self._consumer_group,
+            self._consumer_name,
+            {self._response_stream: ">"},
             block=100
         )
 
-        if not messages:
-            return None
-
-        # Process messages
-        for _, message_list in messages:
-            for message_id, message_data in message_list:
-                try:
-                    # Handle byte string conversion properly
-                    if b'message' in message_data:
-                        message_str = message_data[b'message'].decode('utf-8')
-                        message = json.loads(message_str)
-                        if message["request_id"] == request_id:
-                            logger.debug(
-                                "Found response for request %s", request_id)
-                            return message["response"]
-                except Exception as e:
-                    logger.error("Error parsing message data: %s - %s",
-                                 str(message_data), str(e))
+        if messages:
+            for _, message_list in messages:
+                for message_id, message_data in message_list:
+                    try:
+                        if b'message' in message_data:
+                            # decoders accept bytes directly; skip the
+                            # intermediate str allocation
+                            message = _loads(message_data[b'message'])
+                            self._responses[message["request_id"]] = \
+                                message["response"]
+                        await self.redis_client.xack(
+                            self._response_stream, self._consumer_group,
+                            message_id)
+                    except Exception as e:
+                        logger.error("Error parsing message data: %s - %s",
+                                     str(message_data), str(e))
 
-        return None
+        response = self._responses.pop(request_id, None)
+        if response is not None:
+            logger.debug("Found response for request %s", request_id)
+        return response
 
     async def check_requests(self) -> List[HumanRequest]:
         """Check for pending human requests"""
         if not self.redis_client:
             raise RuntimeError("MessageBroker not initialized")
 
-        # Read new messages from request stream
+        # Read new messages from request stream; count batches a burst of
+        # entries into one round trip instead of one read per message
         messages = await self.redis_client.xreadgroup(
             self._consumer_group,
             self._consumer_name,
             {self._request_stream: ">"},
-            block=100
+            count=64,
+            block=5000
         )
 
         requests = []
+        processed_ids = []
         if messages:
             for stream_name, message_list in messages:
                 for message_id, message_data in message_list:
                     try:
                         if b'message' in message_data:
-                            message_str = message_data[b'message'].decode(
-                                'utf-8')
-                            message = json.loads(message_str)
+                            message = _loads(message_data[b'message'])
                             request_id = message["request_id"]
                             logger.debug(
                                 "Found pending request %s: %s",
@@ -187,11 +240,19 @@ class MessageBroker:
                     except Exception as e:
                         logger.error("Error parsing request message data: %s - %s",
                                      str(message_data), str(e))
+                    processed_ids.append(message_id)
+
+        if processed_ids:
+            # Acknowledge the whole batch so entries leave the pending list
+            await self.redis_client.xack(
+                self._request_stream, self._consumer_group, *processed_ids)
 
         return requests
 
     async def close_connection(self):
         """Close Redis connection"""
         if self.redis_client:
+            # Releases the client's connections back to the shared pool;
+            # the pool itself stays up for other brokers and reconnects
             await self.redis_client.close()
             self.redis_client = None
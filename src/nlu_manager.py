@@ -9,6 +9,9 @@ from config import CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Commands that end the interactive loop
+_EXIT_COMMANDS = frozenset({'exit', 'quit'})
+
 
 class NLUManager:
     """
@@ -40,21 +43,24 @@ class NLUManager:
         """Background task to monitor and handle human assistance requests"""
         while True:
             try:
+                # check_requests long-polls Redis (block=5s), so the loop
+                # parks in the driver instead of spinning on a sleep and a
+                # new request wakes it immediately
                 requests = await self.message_broker.check_requests()
                 for request in requests:
                     self.view.display_human_request(
                         question=request.question_to_human,
                         options=request.options
                     )
-                    response = self.view.get_human_input(
-                        options=request.options)
+                    response = await asyncio.to_thread(
+                        self.view.get_human_input, options=request.options)
                     await self.message_broker.send_response(
                         request_id=request.request_id,
                         response=response
                     )
             except Exception as e:
                 logger.error("Error handling human requests: %s", str(e))
-            await asyncio.sleep(0.1)
+                await asyncio.sleep(0.1)
 
     async def process_command(self, command: str) -> None:
         """
@@ -69,8 +75,9 @@ class NLUManager:
             # Start showing progress
             self.view.start_progress()
 
-            # Get appropriate scenario
-            scenario, score = self.proxy_planner.classify_and_select(command)
+            # Get appropriate scenario; classifiers score concurrently
+            scenario, score = await \
+                self.proxy_planner.classify_and_select_async(command)
 
             if score > 0:
                 logger.info("Selected scenario %s with score %f",
@@ -108,8 +115,10 @@ class NLUManager:
             # Main command processing loop
             while True:
                 try:
-                    command = self.view.get_input()
-                    if command.lower() in ['exit', 'quit']:
+                    # input() blocks; run it in a thread so background
+                    # tasks keep the event loop while the user types
+                    command = await asyncio.to_thread(self.view.get_input)
+                    if command.lower() in _EXIT_COMMANDS:
                         break
 
                     # Process command
@@ -1,3 +1,5 @@
+import asyncio
+from collections import OrderedDict
 from typing import List, Tuple
 from scenarios.base import BaseScenario
 import logging
@@ -7,13 +9,23 @@ logger = logging.getLogger(__name__)
 class ProxyPlanner:
     def __init__(self):
         self.scenarios: List[BaseScenario] = []
+        # Class names resolved once at registration, parallel to scenarios
+        self._names: List[str] = []
         self.MIN_CONFIDENCE_THRESHOLD = 0.3
         self.SIMILAR_SCORES_THRESHOLD = 0.1
+        self.CLASSIFY_CACHE_SIZE = 256
+        # LRU of successful selections per command, keyed on a generation
+        # counter so registering a scenario invalidates stale entries
+        self._classify_cache: OrderedDict[
+            Tuple[int, str], Tuple[int, float]] = OrderedDict()
+        self._generation = 0
     
     def register_scenario(self, scenario: BaseScenario) -> None:
         """Register a new scenario with the planner"""
         self.scenarios.append(scenario)
-        logger.info(f"Registered scenario: {scenario.__class__.__name__}")
+        self._names.append(scenario.__class__.__name__)
+        self._generation += 1
+        logger.info("Registered scenario: %s", self._names[-1])
     
     def classify_and_select(self, command: str) -> Tuple[BaseScenario, float]:
         """
@@ -26,18 +38,83 @@ class ProxyPlanner:
         """
         if not self.scenarios:
             raise RuntimeError("No scenarios registered")
-            
+
+        cached = self._cached_selection(command)
+        if cached is not None:
+            return cached
+
+        matched = self._keyword_match(command)
+        if matched is not None:
+            return matched, 1.0
+
         # Get scores from all scenarios
-        scored_scenarios = [
-            (scenario, scenario.classify_intent(command))
+        scores = [scenario.classify_intent(command)
+                  for scenario in self.scenarios]
+        return self._select_and_cache(command, scores)
+
+    async def classify_and_select_async(self, command: str) -> Tuple[BaseScenario, float]:
+        """
+        Async variant of classify_and_select: classifiers run concurrently
+        in worker threads, so N scenarios cost max(t_i) wall-clock instead
+        of sum(t_i).
+        """
+        if not self.scenarios:
+            raise RuntimeError("No scenarios registered")
+
+        cached = self._cached_selection(command)
+        if cached is not None:
+            return cached
+
+        matched = self._keyword_match(command)
+        if matched is not None:
+            return matched, 1.0
+
+        scores = await asyncio.gather(*(
+            asyncio.to_thread(scenario.classify_intent, command)
             for scenario in self.scenarios
-        ]
-        
+        ))
+        return self._select_and_cache(command, list(scores))
+
+    def _keyword_match(self, command: str) -> BaseScenario | None:
+        """
+        Cheap prefilter: if exactly one scenario's keywords intersect the
+        command tokens, route to it without running any classifiers.
+        Returns None on zero hits or ambiguity.
+        """
+        tokens = frozenset(command.lower().split())
+        matched = None
+        for scenario in self.scenarios:
+            keywords = getattr(scenario, "keywords", None)
+            if isinstance(keywords, (set, frozenset)) and keywords & tokens:
+                if matched is not None:
+                    return None
+                matched = scenario
+        return matched
+
+    def _cached_selection(self, command: str) -> Tuple[BaseScenario, float] | None:
+        """Return a previously selected scenario for this exact command"""
+        key = (self._generation, command)
+        cached = self._classify_cache.get(key)
+        if cached is None:
+            return None
+        self._classify_cache.move_to_end(key)
+        idx, score = cached
+        logger.debug("Classifier cache hit for command: %s", command)
+        return self.scenarios[idx], score
+
+    def _select_and_cache(self,
+                          command: str,
+                          scores: List[float]) -> Tuple[BaseScenario, float]:
+        """Pick the best-scoring scenario from precomputed scores.
+
+        Successful selections are cached by command string so repeated
+        commands skip the classifiers entirely; low-confidence failures
+        raise before caching and are always retried.
+        """
         # Find scenario with highest score
-        selected_scenario, max_score = max(
-            scored_scenarios,
-            key=lambda x: x[1]
-        )
+        best_idx = max(range(len(scores)), key=scores.__getitem__)
+        selected_scenario = self.scenarios[best_idx]
+        max_score = scores[best_idx]
 
         # Check if the best score is too low
         if max_score < self.MIN_CONFIDENCE_THRESHOLD:
@@ -47,10 +124,10 @@ class ProxyPlanner:
 
         # Check for scenarios with similar scores
         similar_scenarios = [
-            (s.__class__.__name__, score) 
-            for s, score in scored_scenarios
-            if abs(score - max_score) <= self.SIMILAR_SCORES_THRESHOLD 
-            and s != selected_scenario
+            (name, score)
+            for idx, (name, score) in enumerate(zip(self._names, scores))
+            if abs(score - max_score) <= self.SIMILAR_SCORES_THRESHOLD
+            and idx != best_idx
         ]
         
         if similar_scenarios:
@@ -59,9 +136,14 @@ class ProxyPlanner:
                 for name, score in similar_scenarios
             )
             logger.warning(
-                f"Multiple scenarios have similar scores to "
-                f"{selected_scenario.__class__.__name__}({max_score:.2f}): {scenarios_list}"
+                "Multiple scenarios have similar scores to %s(%.2f): %s",
+                selected_scenario.__class__.__name__, max_score, scenarios_list
             )
         
-        logger.info(f"Selected scenario {selected_scenario.__class__.__name__} with score {max_score}")
+        logger.info("Selected scenario %s with score %s",
+                    self._names[best_idx], max_score)
+
+        self._classify_cache[(self._generation, command)] = (best_idx, max_score)
+        if len(self._classify_cache) > self.CLASSIFY_CACHE_SIZE:
+            self._classify_cache.popitem(last=False)
         return selected_scenario, max_score
\ No newline at end of file
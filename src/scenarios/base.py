@@ -1,21 +1,61 @@
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+import functools
+import hashlib
+import inspect
+import io
 import json
 import logging
 
+from config import CONFIG
+from llm_cache import DiskResponseCache
 from llm_interface import LLMInterface
 from src.message_broker import MessageBroker
 from src.scenarios.prompts import ANALYZE_ERROR_PROMPT_BASE
 from src.tools.base import EnvTool, ToolBox, ToolExecutionRecord, ToolResponse
-from src.tools.browser.environment import Environment
+from src.tools.browser.environment import Environment, EnvSnapshot
 from pydantic import BaseModel
 
 from src.tools.call_human import CallHumanTool
 
 logger = logging.getLogger(__name__)
 
+# Shared frozen response_format dict – avoids rebuilding it per LLM call
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
+
+# User-message template for recovery analysis; the instructions and tool
+# descriptions travel in the system message instead
+HISTORY_USER_PROMPT = "Step execution history:\n{history}"
+
+# Fixed fragments of the rendered execution history
+_HISTORY_HEADER = "Execution Records:"
+_SUB_COMMAND_HEADER = "\n\n--- Sub-command #"
+_SUB_COMMAND_HEADER_END = " ---\n"
+
+# Cap on concurrently dispatched tools, so a long LLM batch cannot
+# overwhelm the browser environment
+MAX_PARALLEL_TOOLS = 5
+
+# Tool descriptions shared across instances of the same step class;
+# _register_tools is deterministic per class, so N instances (e.g. one
+# RoomBookingStep per room) reuse one description dict
+_TOOL_DESCRIPTIONS_BY_CLASS: dict[type, dict] = {}
+
+
+class NextAction(BaseModel):
+    """Single tool invocation suggested by the analyze-error LLM call"""
+    tool_name: str
+    params: dict
+
+
+class ErrorAnalysis(BaseModel):
+    """Validated shape of the analyze-error LLM response"""
+    analysis: str
+    next_action: NextAction | list[NextAction]
+
 
 class StepStatus(Enum):
     NOT_STARTED = "not_started"
@@ -28,14 +68,39 @@ class StepStatus(Enum):
 class ScenarioStep:
     """Set of tools executed in a sequence to accomplish a scenario step"""
 
+    # Newest records rendered verbatim in the history; older ones collapse
+    # into a one-line summary so prompt size stays bounded under long retries
+    MAX_RAW_HISTORY = int(CONFIG.get("max_raw_history", 10))
+
     def __init__(self):
         self.execution_history: list[ToolExecutionRecord] = []
+        # Rendered history blocks, one per record, appended once at record
+        # time; keeps the prompt prefix byte-identical across retries so
+        # provider prompt caches can reuse it
+        self._history_blocks: list[str] = []
+        # Incremental counters so stats and the failures-only view never
+        # rescan the whole history
+        self._success_count = 0
+        self._failed_indices: list[int] = []
+        # Snapshot debounce: consecutive failures on the same address reuse
+        # the previous describe_state() result
+        self._last_env_address = None
+        self._last_env_state = None
+        # Verifier short-circuit: a failed verify_success is only re-run
+        # once the page address has changed since it last returned False
+        self._last_verify_address = None
         self.status = StepStatus.IN_PROGRESS
+        # Rendered analyze-error system prompt, cached by the owning
+        # scenario on first failure of this step
+        self._system_prompt: str | None = None
+        # Records queued by _queue_tool_execution awaiting a batched flush
+        self._pending_records: list[dict] = []
         self.toolbox = ToolBox()
+        self._register_tools()
 
     @abstractmethod
     def _register_tools(self):
-        """Register available tools for this step"""
+        """Register available tools for this step; called once by __init__"""
         pass
 
     async def _record_tool_execution(
@@ -44,27 +109,82 @@ class ScenarioStep:
             params: dict,
             response: ToolResponse,
             environment: Environment | None = None,
-            header_summary: str | None = None
+            header_summary: str | None = None,
+            env_snapshot: EnvSnapshot | None = None,
+            timestamp: datetime | None = None
     ) -> None:
-        """Record tool execution and capture browser state if error occurred"""
+        """Record tool execution and capture browser state if error occurred.
+
+        When the caller already fetched an EnvSnapshot for this moment it is
+        passed via env_snapshot, and no further environment probes happen
+        here.
+        """
         env_params = None
         if not response.success:
+            if env_snapshot is not None:
+                self._last_env_address = env_snapshot.address
+                self._last_env_state = env_snapshot.state
+                env_params = {
+                    "env_address": env_snapshot.address,
+                    "env_state": env_snapshot.state
+                }
             # Get concise browser state description
-            if environment:
+            elif environment:
+                address = environment.current_state_address()
+                if address == self._last_env_address:
+                    # Same page as the previous failure and nothing
+                    # succeeded in between: reuse the snapshot instead of
+                    # re-serializing the DOM
+                    state = self._last_env_state
+                else:
+                    state = await environment.describe_state()
+                    self._last_env_address = address
+                    self._last_env_state = state
                 env_params = {
-                    "env_address": environment.current_state_address(),
-                    "env_state": await environment.describe_state()
+                    "env_address": address,
+                    "env_state": state
                 }
+        elif environment:
+            # A successful action may have changed the page without moving
+            # the address; drop the cached snapshot and the verifier
+            # short-circuit along with it
+            self._last_env_address = None
+            self._last_env_state = None
+            self._last_verify_address = None
 
         record = ToolExecutionRecord(
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
             tool_name=tool_name,
             tool_params=params,
             response=response,
             env_params=env_params,
-            header_summary=header_summary
+            header_summary=header_summary,
         )
         self.execution_history.append(record)
+        if response.success:
+            self._success_count += 1
+        else:
+            self._failed_indices.append(len(self.execution_history))
+        self._history_blocks.append(
+            f"\n--- Sub-command #{len(self.execution_history)} ---")
+        self._history_blocks.append(record.to_history_text())
+
+    def _queue_tool_execution(self, **kwargs) -> None:
+        """Buffer a tool-execution record for a later batched flush.
+
+        Scripted steps queue their records synchronously on the hot path
+        and flush once, instead of awaiting the recording (and its
+        potential environment probe) after every tool call. The execution
+        timestamp is captured here, at queue time.
+        """
+        kwargs.setdefault("timestamp", datetime.now())
+        self._pending_records.append(kwargs)
+
+    async def _flush_records(self) -> None:
+        """Record all queued executions in their original order"""
+        pending, self._pending_records = self._pending_records, []
+        for kwargs in pending:
+            await self._record_tool_execution(**kwargs)
 
     def get_execution_history(self, include_successful: bool = True) -> str:
         """
@@ -80,29 +200,95 @@ class ScenarioStep:
         if not self.execution_history:
             return "No execution history available."
 
-        history_sections = []
-
-        # Add step metadata
-        history_sections.append(f"Step Status: {self.status.value}")
-        history_sections.append(
-            f"Total executions: {len(self.execution_history)}")
-
-        # Calculate success rate
-        successful = sum(1 for record in self.execution_history
-                         if record.response.success)
-        success_rate = (successful / len(self.execution_history)) * 100
-        history_sections.append(f"Success rate: {success_rate:.1f}%")
-
-        # Add individual execution records
-        history_sections.append("\nExecution Records:")
-        for idx, record in enumerate(self.execution_history, 1):
-            if record.response.success and not include_successful:
-                continue
+        # Write into one StringIO buffer instead of accumulating small
+        # f-strings in a list; fixed fragments are module-level constants
+        buf = io.StringIO()
+        buf.write(_HISTORY_HEADER)
+
+        # Static preamble + append-only record blocks first: between retries
+        # only new blocks are added at the end, so the already-sent prefix
+        # stays identical and provider prompt caching keeps matching it
+        if include_successful:
+            omitted = len(self.execution_history) - self.MAX_RAW_HISTORY
+            if omitted > 0:
+                buf.write("\n")
+                buf.write(self._summarize_omitted(omitted))
+                blocks = self._history_blocks[2 * omitted:]
+            else:
+                blocks = self._history_blocks
+            for block in blocks:
+                buf.write("\n")
+                buf.write(block)
+        else:
+            newest_failed = (self._failed_indices[-1]
+                             if self._failed_indices else None)
+            for idx in self._failed_indices:
+                record = self.execution_history[idx - 1]
+                buf.write(_SUB_COMMAND_HEADER)
+                buf.write(str(idx))
+                buf.write(_SUB_COMMAND_HEADER_END)
+                # Only the newest failure carries the full env snapshot;
+                # older ones keep just the address reference
+                buf.write(record.to_history_text(
+                    include_env_state=(idx == newest_failed)))
+
+        # Volatile stats go last so they never shift the shared prefix
+        success_rate = (self._success_count / len(self.execution_history)) * 100
+        buf.write(f"\n\nStep Status: {self.status.value}\n"
+                  f"Total executions: {len(self.execution_history)}\n"
+                  f"Success rate: {success_rate:.1f}%")
+
+        return buf.getvalue()
+
+    def _summarize_omitted(self, omitted: int, start: int = 0) -> str:
+        """One-line stand-in for records evicted from the rendered history.
+
+        Summarizes records start+1 .. start+omitted (1-based indices).
+        """
+        omitted_failures = [idx for idx in self._failed_indices
+                            if start < idx <= start + omitted]
+        if omitted_failures:
+            last_failed = self.execution_history[omitted_failures[-1] - 1]
+            detail = (f"; last omitted failure: tool={last_failed.tool_name}"
+                      f" error={last_failed.response.error}")
+        else:
+            detail = ""
+        return (f"\n[{omitted} earlier executions omitted "
+                f"({len(omitted_failures)} failed){detail}]")
+
+    @functools.cached_property
+    def tool_descriptions(self) -> dict:
+        """Tool descriptions for this step, built once per step class.
+
+        The toolbox is populated at construction and never changes, so the
+        description dict — and any prompt rendered from it — stays stable
+        for the step's lifetime and is shared across sibling instances.
+        """
+        cached = _TOOL_DESCRIPTIONS_BY_CLASS.get(type(self))
+        if cached is None:
+            cached = self.toolbox.get_tools_description()
+            _TOOL_DESCRIPTIONS_BY_CLASS[type(self)] = cached
+        return cached
 
-            history_sections.append(f"\n--- Sub-command #{idx} ---")
-            history_sections.append(record.to_history_text())
+    def render_history_delta(self, start_record: int) -> str:
+        """
+        Render only the records appended after start_record.
 
-        return "\n".join(history_sections)
+        Used by the recovery loop to send each new execution as its own
+        message instead of resending the whole history every retry.
+        """
+        start = max(start_record, 0)
+        blocks = self._history_blocks[2 * start:]
+        if not blocks:
+            return "No new tool executions since the previous message."
+        # Same cap as the full rendering: a delta carrying more than
+        # MAX_RAW_HISTORY records (typically the first send of a long
+        # scripted step) collapses its oldest ones into the summary line
+        omitted = len(self.execution_history) - start - self.MAX_RAW_HISTORY
+        if omitted > 0:
+            summary = self._summarize_omitted(omitted, start=start)
+            return "\n".join([summary, *blocks[2 * omitted:]])
+        return "\n".join(blocks)
 
     @abstractmethod
     async def verify_success(
@@ -111,6 +297,28 @@ class ScenarioStep:
         """Verify step completion based on success criteria"""
         pass
 
+    async def verify_success_cached(
+            self,
+            environment: Environment | None = None) -> bool:
+        """verify_success with a state-address short-circuit.
+
+        If the previous verification returned False and the environment is
+        still on the same address (and nothing succeeded in between), the
+        outcome cannot have changed — skip the full browser probe. A True
+        result is never cached: success always comes from a real check.
+        """
+        if environment is None:
+            return await self.verify_success(environment=environment)
+        address = environment.current_state_address()
+        if address == self._last_verify_address:
+            logger.debug(
+                "Skipping verify_success: address unchanged since last "
+                "failed check (%s)", address)
+            return False
+        result = await self.verify_success(environment=environment)
+        self._last_verify_address = None if result else address
+        return result
+
     @abstractmethod
     async def execute(self, env=None, **kwargs) -> bool:
         """Execute the step"""
@@ -145,6 +353,9 @@ class BaseScenario(ABC):
     """Base class for all scenarios"""
     MAX_CONSECUTIVE_RETRIES = 3  # Max times to retry same action with LLM
     MAX_TOTAL_RETRIES = 12  # Max total retries per step with LLM
+    # Exact command tokens that identify this scenario unambiguously; lets
+    # the planner route without calling classify_intent. Empty = no fast path.
+    keywords: set[str] = set()
 
     def __init__(
             self,
@@ -161,6 +372,12 @@ class BaseScenario(ABC):
         self.environment: Environment | None = None
         # prompt with history and tool_descriptions variables
         self.analyze_error_prompt: str = ANALYZE_ERROR_PROMPT_BASE
+        # One CallHumanTool shared across all human interactions of this
+        # scenario instead of a fresh instance per question
+        self._call_human_tool = CallHumanTool()
+        # Byte-exact repeats of an analyze-error context (same page, same
+        # failure) skip the LLM entirely, across process restarts too
+        self._analysis_cache = DiskResponseCache()
 
     def initialize_context(self, command: str, parsed_params: dict):
         self.context = ScenarioContext(
@@ -181,7 +398,12 @@ class BaseScenario(ABC):
 
     @abstractmethod
     def parse_command(self, command: str) -> BaseModel:
-        """Parse natural language command into structured parameters"""
+        """Parse natural language command into structured parameters.
+
+        Implementations may be either sync or async; execute() awaits
+        coroutine implementations and pushes blocking ones to a worker
+        thread.
+        """
         pass
 
     async def _handle_step_failure(self, current_step: ScenarioStep) -> bool:
@@ -204,10 +426,25 @@ class BaseScenario(ABC):
                     self.context.current_step_index)
 
         total_retries = 0
-        consecutive_same_actions = 1
-        last_action = None  # Tuple of (tool_name, frozen_params)
-
-        tool_descriptions = current_step.toolbox.get_tools_description()
+        # Occurrences of each suggested action, keyed by its _action_key
+        # digest; catches loops even when repeats are not consecutive
+        action_counts: dict[bytes, int] = {}
+
+        # Instructions + tool descriptions rendered once per step and sent
+        # as the system message: byte-identical across retries and repeated
+        # failures, so providers can serve it from their prompt cache while
+        # only the history changes
+        system_prompt = self._system_prompt_for(current_step)
+        # Multi-turn conversation: each retry appends the LLM's last answer
+        # and only the new execution records, so tokens per iteration are
+        # O(new records) and the earlier turns form a stable cacheable prefix
+        chat_messages: list[dict] = [
+            {"role": "system", "content": system_prompt}]
+        records_sent = 0
+        # (action key, error signature) of the last failed recovery action;
+        # when a round reproduces it exactly the next analysis would see
+        # nothing new, so the LLM round trip is skipped
+        last_failure = None
 
         while total_retries < self.MAX_TOTAL_RETRIES:
             logger.info(
@@ -215,37 +452,94 @@ class BaseScenario(ABC):
                 "="*50,
                 total_retries + 1, self.MAX_TOTAL_RETRIES
             )
-            history = current_step.get_execution_history(
-                include_successful=True)
-            # write execution history to file (add if exists)
-            with open("execution_history.txt", "a") as f:
-                f.write(history)
-                f.write("\n\n")
+            new_history = current_step.render_history_delta(records_sent)
+            records_sent = len(current_step.execution_history)
+            chat_messages.append({
+                "role": "user",
+                "content": HISTORY_USER_PROMPT.format(history=new_history)
+            })
+            # write execution history to file (add if exists) without
+            # blocking the event loop on disk I/O
+            await asyncio.to_thread(self._append_history_file, new_history)
+
+            cache_key = self._analysis_cache_key(current_step)
 
             try:
-                # Get LLM's analysis and next action
-                response = self.llm_brain.send_request(
-                    prompt=self.analyze_error_prompt,
-                    call_params={
-                        "history": history,
-                        "tool_descriptions": tool_descriptions,
-                    },
-                    response_format={"type": "json_object"}
-                )
-
-                analysis = self.llm_brain.get_response_content(response)
-                logger.info("LLM Response full:\n%s",
-                            json.dumps(analysis, indent=4, ensure_ascii=False))
-                logger.info("LLM analysis: %s", analysis["analysis"])
+                parsed = self._analysis_cache.get(cache_key)
+                from_cache = parsed is not None
+                if from_cache:
+                    logger.info(
+                        "Reusing cached analysis for identical context")
+                else:
+                    # Get LLM's analysis and next action; send_request is a
+                    # blocking HTTP call, so run it in a worker thread to
+                    # keep the event loop (browser I/O, human-request
+                    # handler) alive during LLM latency
+                    response = await asyncio.to_thread(
+                        self.llm_brain.send_request,
+                        messages=chat_messages,
+                        response_format=JSON_RESPONSE_FORMAT
+                    )
+                    parsed = self.llm_brain.get_response_content(response)
+
+                # Validate once, then use attribute access everywhere;
+                # malformed responses fail fast here instead of deep in
+                # the action loop
+                analysis = ErrorAnalysis.model_validate(parsed)
+                if not from_cache:
+                    # Cache only after validation so malformed responses
+                    # are retried instead of persisted
+                    self._analysis_cache.set(cache_key, parsed)
+                chat_messages.append({
+                    "role": "assistant",
+                    "content": analysis.model_dump_json()
+                })
+                if logger.isEnabledFor(logging.DEBUG):
+                    # indent=4 re-serialization is only worth paying when
+                    # the line will actually be emitted
+                    logger.debug("LLM Response full:\n%s",
+                                 analysis.model_dump_json(indent=4))
+                logger.info("LLM analysis: %s", analysis.analysis)
+
+                # Extract suggested actions
+                actions = analysis.next_action
+                if not isinstance(actions, list):
+                    actions = [actions]
+
+                # Error signature the plan was generated against: if an
+                # executed action fails differently, the remaining plan
+                # elements are stale and a fresh analysis is cheaper than
+                # blindly finishing them
+                plan_error_sig = None
+                if current_step._failed_indices:
+                    plan_error_sig = _error_signature(
+                        current_step.execution_history[
+                            current_step._failed_indices[-1] - 1
+                        ].response.error)
+
+                if (len(actions) > 1 and all(
+                        action.tool_name in current_step.toolbox
+                        and current_step.toolbox.get_tool(
+                            action.tool_name).parallel_safe
+                        for action in actions)):
+                    # All suggested actions are independent reads: dispatch
+                    # them concurrently, wall-clock max(t_i) not sum(t_i)
+                    await self._execute_parallel_actions(
+                        current_step, actions, total_retries)
+                    total_retries += 1
+                    if await current_step.verify_success_cached(
+                            environment=self.environment):
+                        logger.info(
+                            "Recovery successful after %d attempts",
+                            total_retries
+                        )
+                        return True
+                    continue
 
-                # Extract suggested action
-                if not isinstance(analysis["next_action"], list):
-                    # wrap dict inside into a list
-                    analysis["next_action"] = [analysis["next_action"]]
-                for action in analysis["next_action"]:
+                for action in actions:
 
-                    tool_name = action["tool_name"]
-                    tool_params = action["params"]
+                    tool_name = action.tool_name
+                    tool_params = action.params
 
                     # Check if tool exists
                     if tool_name not in current_step.toolbox:
@@ -253,25 +547,20 @@ class BaseScenario(ABC):
                             "LLM suggested unknown tool: %s", tool_name)
                         return False
 
-                    # Create frozen version of params for comparison
-                    current_action = (
-                        tool_name,
-                        _freeze_params(tool_params)
-                    )
-
-                    # Check if we're repeating the same action
-                    if current_action == last_action:
-                        consecutive_same_actions += 1
-                        if consecutive_same_actions >= self.MAX_CONSECUTIVE_RETRIES:
-                            logger.warning(
-                                "Stopping: Same action attempted %d times consecutively: %s %s",
-                                consecutive_same_actions, tool_name, tool_params
-                            )
-                            return False
-                    else:
-                        consecutive_same_actions = 1
-
-                    last_action = current_action
+                    # Constant-size identity key for repetition detection
+                    current_action = _action_key(tool_name, tool_params)
+
+                    # Check if we're repeating the same action; the count is
+                    # global across the recovery session, so A-B-A-B loops
+                    # terminate as fast as A-A-A ones
+                    seen = action_counts.get(current_action, 0) + 1
+                    action_counts[current_action] = seen
+                    if seen >= self.MAX_CONSECUTIVE_RETRIES:
+                        logger.warning(
+                            "Stopping: Same action attempted %d times during recovery: %s %s",
+                            seen, tool_name, tool_params
+                        )
+                        return False
 
                     # Execute suggested tool
                     logger.info(
@@ -300,21 +589,47 @@ class BaseScenario(ABC):
                         tool_params["env"] = self.environment
                     result = await tool.execute(**tool_params)
 
+                    # One browser probe for this moment, reused by the
+                    # execution record instead of a second describe_state
+                    snap = None
+                    if not result.success and self.environment is not None:
+                        snap = await self.environment.snapshot()
+
                     # Record tool execution
                     await current_step._record_tool_execution(
                         tool_name=tool_name,
                         params=tool_params,
                         response=result,
                         environment=self.environment,
-                        header_summary=f"Recovery attempt {total_retries + 1}"
+                        header_summary=f"Recovery attempt {total_retries + 1}",
+                        env_snapshot=snap
                     )
-                    if await current_step.verify_success(environment=self.environment):
+                    if await current_step.verify_success_cached(environment=self.environment):
                         logger.info(
                             "Recovery successful after %d attempts",
                             total_retries + 1
                         )
                         return True
 
+                    if not result.success:
+                        err_sig = _error_signature(result.error)
+                        # The suggested retry reproduced the previous
+                        # failure exactly — the LLM has no new information
+                        # and will repeat itself, so bail out instead of
+                        # paying for a redundant round trip
+                        if (current_action, err_sig) == last_failure:
+                            logger.warning(
+                                "Stopping: repeated action failed with the "
+                                "identical error, no new information for "
+                                "the next analysis")
+                            return False
+                        last_failure = (current_action, err_sig)
+                        if err_sig != plan_error_sig:
+                            logger.info(
+                                "Error signature changed mid-plan, "
+                                "requesting a fresh analysis")
+                            break
+
                 # Check if step successful after this action
                 # if await current_step.verify_success(environment=self.environment):
                 #     logger.info(
@@ -339,6 +654,84 @@ class BaseScenario(ABC):
         )
         return False
 
+    def _analysis_cache_key(self, current_step: ScenarioStep) -> str:
+        """Restart-stable disk cache key for the analyze-error call.
+
+        The rendered chat messages are unusable as a key: every history
+        block embeds a wall-clock timestamp and recovery params can carry
+        live object reprs, so a digest of them is unique per call. Digest
+        only what determines the analysis instead — the failing action
+        (runtime handles excluded), its error text and the page address.
+        """
+        parts = [type(current_step).__name__]
+        if current_step._failed_indices:
+            record = current_step.execution_history[
+                current_step._failed_indices[-1] - 1]
+            parts.append(
+                _action_key(record.tool_name, record.tool_params).hex())
+            parts.append(record.response.error or "")
+            if record.env_params is not None:
+                parts.append(str(record.env_params.get("env_address", "")))
+        return DiskResponseCache.key_for("\x00".join(parts))
+
+    def _system_prompt_for(self, current_step: ScenarioStep) -> str:
+        """Render the analyze-error system prompt once per step instance"""
+        if current_step._system_prompt is None:
+            current_step._system_prompt = self.analyze_error_prompt.format(
+                history="(see the user messages)",
+                tool_descriptions=current_step.tool_descriptions
+            )
+        return current_step._system_prompt
+
+    @staticmethod
+    def _append_history_file(text: str) -> None:
+        """Append a history delta to the execution_history.txt debug file"""
+        with open("execution_history.txt", "a") as f:
+            f.write(text)
+            f.write("\n\n")
+
+    async def _execute_parallel_actions(
+            self,
+            current_step: ScenarioStep,
+            actions: list[NextAction],
+            total_retries: int
+    ) -> None:
+        """
+        Execute a batch of read-only tool actions concurrently.
+
+        Results are recorded in the original suggestion order so the
+        execution history stays deterministic. Never used for tools that
+        mutate state or for CallHumanTool.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TOOLS)
+
+        async def run(action: NextAction):
+            tool = current_step.toolbox.get_tool(action.tool_name)
+            params = dict(action.params)
+            if "env" not in params and isinstance(tool, EnvTool):
+                params["env"] = self.environment
+            async with semaphore:
+                try:
+                    return params, await tool.execute(**params)
+                except Exception as e:
+                    return params, ToolResponse(success=False, error=str(e))
+
+        logger.info(
+            "Executing %d read-only recovery actions in parallel (attempt %d)",
+            len(actions), total_retries + 1
+        )
+        results = await asyncio.gather(*(run(action) for action in actions))
+
+        for action, (params, result) in zip(actions, results):
+            await current_step._record_tool_execution(
+                tool_name=action.tool_name,
+                params=params,
+                response=result,
+                environment=self.environment,
+                header_summary=f"Recovery attempt {total_retries + 1} "
+                               "(parallel)"
+            )
+
     async def _handle_human_interaction(
         self,
         current_step: ScenarioStep,
@@ -371,8 +764,7 @@ class BaseScenario(ABC):
             )
 
             # Execute human tool with configured message broker
-            call_human_tool = CallHumanTool()
-            result = await call_human_tool.execute(
+            result = await self._call_human_tool.execute(
                 broker=self.message_broker,
                 question_to_human=params["question_to_human"],
                 scenario_id=self.context.original_command,
@@ -414,8 +806,14 @@ class BaseScenario(ABC):
         logger.info("Starting scenario %s execution for command: %s",
                     self.__class__.__name__, command)
 
-        # Parse command and initialize context
-        parsed_params = self.parse_command(command)
+        # Parse command and initialize context; async implementations run
+        # directly on the loop, blocking ones go to a worker thread so the
+        # LLM round-trip never stalls concurrent startup work
+        if inspect.iscoroutinefunction(self.parse_command):
+            parsed_params = await self.parse_command(command)
+        else:
+            parsed_params = await asyncio.to_thread(
+                self.parse_command, command)
         self.initialize_context(
             command=command,
             parsed_params=parsed_params.model_dump())
@@ -467,18 +865,61 @@ class BaseScenario(ABC):
             self.context.status = ScenarioStatus.FAILED
             return False
 
+    async def execute_batch(self, commands: list[str]) -> list[bool]:
+        """
+        Execute several commands on this scenario, returning results in
+        input order.
+
+        Commands run one after another because a scenario instance carries
+        mutable per-command state (context, steps, environment); the
+        concurrency win for batch workloads comes from
+        LLMInterface.send_request_batch underneath each execution.
+        """
+        results = []
+        for command in commands:
+            results.append(await self.execute(command))
+        return results
+
     def _log_execution(self, command: str) -> None:
         """Helper to log execution attempts"""
         logger.info(
-            f"Executing {self.__class__.__name__} with command: {command}"
+            "Executing %s with command: %s",
+            self.__class__.__name__, command
         )
 
 
-def _freeze_params(params: dict) -> tuple:
-    """Convert dictionary values into hashable types for comparison"""
-    frozen_items = []
-    for k, v in params.items():
-        if isinstance(v, list):
-            v = tuple(v)  # Convert list to tuple
-        frozen_items.append((k, v))
-    return tuple(frozen_items)
+def _error_signature(error: str | None) -> bytes:
+    """Compact digest of an error message for staleness comparisons"""
+    return hashlib.blake2b(
+        (error or "").encode("utf-8"), digest_size=8).digest()
+
+
+def _action_key(tool_name: str, params: dict) -> bytes:
+    """Constant-size identity digest for an action.
+
+    Runtime handles (env/environment) are excluded: they are process
+    singletons, not part of what the action semantically does.
+    """
+    semantic = {key: value for key, value in params.items()
+                if key not in ("env", "environment")}
+    return hashlib.blake2b(
+        tool_name.encode("utf-8") + b"\x00" + _freeze_params(semantic),
+        digest_size=16
+    ).digest()
+
+
+try:
+    import orjson
+
+    def _freeze_params(params: dict) -> bytes:
+        """Canonical byte key for params: C-accelerated, nesting-safe"""
+        return orjson.dumps(
+            params,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=repr,
+        )
+except ImportError:
+    def _freeze_params(params: dict) -> bytes:
+        """Canonical byte key for params via sorted-keys stdlib json"""
+        return json.dumps(
+            params, sort_keys=True, default=repr).encode("utf-8")
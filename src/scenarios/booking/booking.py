@@ -1,100 +1,42 @@
-from datetime import datetime, time
-from pydantic import BaseModel, Field, model_validator
+import asyncio
+import functools
+import re
+
 from scenarios.base import BaseScenario, ScenarioStep
 import logging
 from config import CONFIG
+from llm_cache import DiskResponseCache
 from src.message_broker import MessageBroker
 from src.scenarios.booking.filling_form_step import RoomBookingStep
 from src.scenarios.booking.login_step import LoginStep
+from src.scenarios.booking.models import BookingParams, PARSE_BOOKING_PROMPT
 from src.scenarios.booking.navigate_step import NavigateToBookingStep
 from src.tools.browser.environment import BrowserEnvironment
-from tools.date import CurrentDateTool, next_thursday
+from tools.date import CurrentDateTool
 from llm_interface import LLMInterface
-from pydantic.functional_validators import BeforeValidator
-from typing import Annotated
 from src.scenarios.prompts import ANALYZE_ERROR_PROMPT_BROWSER, ANALYZE_ERROR_PROMPT_BROWSER_MULTI
 
 logger = logging.getLogger(__name__)
 
-default_booking_params = CONFIG.default_booking_params
-
-DateFormatConvert = Annotated[
-    datetime,
-    BeforeValidator(lambda x: datetime.strptime(
-        x, "%d-%m-%Y") if isinstance(x, str) else x)
-]
-TimeFormatConvert = Annotated[
-    time,
-    BeforeValidator(lambda x: datetime.strptime(
-        x, "%H:%M").time() if isinstance(x, str) else x)
-]
-
-
-class BookingParams(BaseModel):
-    room_count: int = Field(description="Number of rooms to book")
-    room_numbers: list[str] | None = Field(
-        description="List of preferred room numbers if specified", default=None)
-    event_name: str = Field(
-        description="Name of the event",
-        default=default_booking_params.event_name)
-    date: DateFormatConvert = Field(
-        description="Calculated booking date in DD-MM-YYYY   format",
-        default=next_thursday())
-    start_time: TimeFormatConvert = Field(
-        description="Start time of booking in HH:MM format",
-        default=datetime.strptime(
-            default_booking_params.start_time, "%H:%M").time())
-    end_time: TimeFormatConvert = Field(
-        description="End time of booking in HH:MM format",
-        default=datetime.strptime(
-            default_booking_params.end_time, "%H:%M").time())
-    building: str = Field(
-        description="Building name if specified",
-        default=default_booking_params.building)
-
-
-PARSE_BOOKING_PROMPT = """Parse the booking command and extract parameters.
-Current date: {current_date}
-Command: {user_command}
-
-Return a JSON with this structure:
-{{
-    "room_count": int,
-    "room_numbers": [str] | null, # Extract room number mentions from the command, the number of mentions can be different from room count, if no mentions - null
-    "event_name": str \ null,
-    "date": "DD-MM-YYYY" | null, # You should calculate this based on the current date
-    "start_time": "HH:MM" | null,
-    "end_time": "HH:MM" | null,
-    "building": string | null
-}}
-
-Return only valid JSON without comments or explanations.
-
-Example input:
-Current date: 07 January 2025, Tuesday
-Command: "забронируй 3 аудитории на следующий четверг с 6 до 10 вечера на кронверкском проспекте, особенно 1405"
-
-Example output:
-{{
-    "room_count": 3,
-    "room_numbers": ["1405"],
-    "event_name": null,
-    "date": 09-01-2025",
-    "start_time": "18:00",
-    "end_time": "22:00",
-    "building": "Кронверкский проспект"
-}}"""
+# Shared frozen response_format dict – avoids rebuilding it per LLM call
+JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
 
 class BookingScenario(BaseScenario):
     """Scenario for handling room booking requests with authentication support"""
 
+    keywords = {"бронь", "бронирование"}
+
+    # Stems compiled once into a single case-insensitive pattern; the scan
+    # runs in C and needs no lowercased copy of the command
+    _BOOKING_RE = re.compile("|".join(map(re.escape, ["брон"])),
+                             re.IGNORECASE)
+
     def __init__(self,
                  message_broker: MessageBroker | None = None,
                  llm_brain: LLMInterface | None = None):
         super().__init__(llm_brain=llm_brain,
                          message_broker=message_broker)
-        self.current_date = CurrentDateTool().execute()
         # Initialize steps
         self.steps = [
             LoginStep(),
@@ -102,10 +44,24 @@ class BookingScenario(BaseScenario):
         ]
         # Initialize browser environment
         self.environment = BrowserEnvironment()
-        self.analyze_error_prompt = ANALYZE_ERROR_PROMPT_BROWSER
-        # self.analyze_error_prompt = ANALYZE_ERROR_PROMPT_BROWSER_MULTI
+        # Multi-action prompt: one analysis yields an ordered plan of up
+        # to 3 tools, so a typical recovery costs 1-2 LLM round-trips
+        # instead of one per action
+        self.analyze_error_prompt = ANALYZE_ERROR_PROMPT_BROWSER_MULTI
+        # Repeated commands on the same day parse identically (relative
+        # dates resolve per day), so their LLM parses are reused from disk
+        self._parse_cache = DiskResponseCache()
         
 
+    @functools.cached_property
+    def current_date(self) -> dict:
+        """Current date in the formats the parse prompt needs.
+
+        Computed on first parse rather than in __init__, so instantiating
+        the scenario for registration/classification costs nothing.
+        """
+        return CurrentDateTool().execute()
+
     def initialize_context(self, command: str, parsed_params: dict):
         super().initialize_context(command, parsed_params)
 
@@ -122,11 +78,21 @@ class BookingScenario(BaseScenario):
 
     async def execute(self, command: str) -> bool:
         """Execute the booking scenario"""
-        # Initialize browser environment
-
-        await self.environment.initialize()
-
-        return await super().execute(command)
+        # Chromium boot and the LLM parse are independent and each take
+        # seconds; launch the browser in the background so it boots while
+        # the parse round-trip is in flight
+        self._env_ready = asyncio.create_task(self.environment.initialize())
+        try:
+            return await super().execute(command)
+        finally:
+            # Never leave the launch task dangling if parsing failed early
+            await self._env_ready
+
+    async def _execute_step(self, step: ScenarioStep):
+        # Steps touch the page, so the overlapped browser launch must have
+        # finished by now; awaiting a completed task is free
+        await self._env_ready
+        return await super()._execute_step(step)
 
     def classify_intent(self, command: str) -> float:
         """
@@ -138,21 +104,23 @@ class BookingScenario(BaseScenario):
         Returns:
             float: 1.0 if booking-related, 0.0 otherwise
         """
-        command = command.lower()
-        booking_stems = ['брон']
-
-        for stem in booking_stems:
-            if stem in command:
-                logger.info("Booking intent detected with stem '%s'", stem)
-                return 1.0
+        match = self._BOOKING_RE.search(command)
+        if match:
+            logger.info("Booking intent detected with stem '%s'",
+                        match.group())
+            return 1.0
 
         logger.info("No booking intent detected")
         return 0.0
 
-    def parse_command(self, command: str, **kwargs) -> BookingParams:
+    async def parse_command(self, command: str, **kwargs) -> BookingParams:
         """
         Parse natural language booking command into structured parameters
 
+        Runs as a coroutine on top of send_request_async, so the LLM
+        round-trip shares the event loop with browser startup instead of
+        blocking it.
+
         Args:
             command: User's natural language command
             **kwargs: Additional parameters for LLM interface
@@ -160,28 +128,39 @@ class BookingScenario(BaseScenario):
         Returns:
             BookingParams: Structured booking parameters
         """
-        response = self.llm_brain.send_request(
+        cache_key = DiskResponseCache.key_for(
+            f"{command}|{self.current_date['readable']}")
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Reusing cached parse for command: %s", command)
+            return BookingParams.model_validate(cached)
+
+        response = await self.llm_brain.send_request_async(
             prompt=PARSE_BOOKING_PROMPT,
             call_params={"user_command": command,
                          "current_date": self.current_date["readable"]},
-            response_format={"type": "json_object"},
+            response_format=JSON_RESPONSE_FORMAT,
             **kwargs
         )
         parsed = self.llm_brain.get_response_content(response)
         if parsed['room_numbers'] is None or len(parsed['room_numbers']) < parsed['room_count']:
             logger.info("Not all room numbers specified, adding default rooms")
             room_numbers_new = parsed['room_numbers'] or []
+            excluded = set(room_numbers_new)
             possible_rooms = CONFIG.default_booking_params.preferred_rooms
             possible_rooms = [
-                room for room in possible_rooms if room not in room_numbers_new]
+                room for room in possible_rooms if room not in excluded]
             room_numbers_new.extend(
                 possible_rooms[:parsed['room_count'] - len(room_numbers_new)])
             logger.info("Extended room numbers: %s", room_numbers_new)
             parsed['room_numbers'] = room_numbers_new
 
-        result_clean = {key: value for key,
-                        value in parsed.items() if value is not None}
-
-        params = BookingParams(**result_clean)
-        logger.info("Parsed booking parameters: %s", params)
+        # Null fields fall back to model defaults inside validation, so
+        # the parsed dict goes in as-is with no filtering pass
+        params = BookingParams.model_validate(parsed)
+        # Cache only after validation so malformed parses are retried
+        self._parse_cache.set(cache_key, parsed)
+        if logger.isEnabledFor(logging.INFO):
+            # repr of the full model is non-trivial; skip it when dropped
+            logger.info("Parsed booking parameters: %s", params)
         return params
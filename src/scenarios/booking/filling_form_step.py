@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime, time
 from typing import List, Dict
@@ -20,7 +21,9 @@ class RoomBookingStep(ScenarioStep):
         super().__init__()
         self.room_number = room_number
         self.meta = meta
-        self._register_tools()
+        # History recording runs off the critical path; tasks are awaited
+        # together at the end of execute()
+        self._bg_records: list[asyncio.Task] = []
 
     def _register_tools(self):
         self.toolbox.register_tool(
@@ -34,8 +37,17 @@ class RoomBookingStep(ScenarioStep):
         """Execute room booking sequence"""
         logger.info("Booking room %s", self.room_number)
 
-        # Step 1: Open form
-        form_result = await MetaBookingFormTool().execute(
+        try:
+            return await self._execute_booking(env)
+        finally:
+            # Surface recording errors without ever blocking the form flow
+            await asyncio.gather(*self._bg_records, return_exceptions=True)
+            self._bg_records.clear()
+
+    async def _execute_booking(self, env) -> bool:
+        # Step 1: Open form; reuse the toolbox instances registered at
+        # construction instead of building fresh tools per room
+        form_result = await self.toolbox.get_tool("MetaBookingFormTool").execute(
             env=env,
             room_number=self.room_number,
             start_time=self.meta['start_time'],
@@ -43,56 +55,58 @@ class RoomBookingStep(ScenarioStep):
             building=self.meta['building'],
             date=self.meta['date'].strftime("%d-%m-%Y")
         )
-        await self._record_tool_execution(
-            tool_name="MetaBookingFormTool",
-            params={
-                "room_number": self.room_number,
-                "start_time": self.meta['start_time'],
-                "end_time": self.meta['end_time'],
-                "building": self.meta['building'],
-                "date": self.meta['date'].strftime("%d-%m-%Y")
-            },
-            response=form_result,
-            environment=env,
-            header_summary=f"Opening booking form for room {self.room_number}"
-        )
+        self._bg_records.append(asyncio.create_task(
+            self._record_tool_execution(
+                tool_name="MetaBookingFormTool",
+                params={
+                    "room_number": self.room_number,
+                    "start_time": self.meta['start_time'],
+                    "end_time": self.meta['end_time'],
+                    "building": self.meta['building'],
+                    "date": self.meta['date'].strftime("%d-%m-%Y")
+                },
+                response=form_result,
+                environment=env,
+                header_summary=f"Opening booking form for room {self.room_number}"
+            )))
 
         if not form_result.success:
             return False
 
         # Step 2: Fill and submit
-        fill_result = await MetaFillBookingFormTool().execute(
+        fill_result = await self.toolbox.get_tool("MetaFillBookingFormTool").execute(
             env=env,
             event_name=self.meta['event_name'],
             start_time=self.meta['start_time'],
             end_time=self.meta['end_time'],
             save_as_draft=True
         )
-        await self._record_tool_execution(
-            tool_name="MetaFillBookingFormTool",
-            params={
-                "event_name": f"Room {self.room_number} Booking",
-                "start_time": self.meta['start_time'],
-                "end_time": self.meta['end_time'],
-                "save_as_draft": True
-            },
-            response=fill_result,
-            environment=env,
-            header_summary=f"Filling and submitting booking form for room {self.room_number}"
-        )
+        self._bg_records.append(asyncio.create_task(
+            self._record_tool_execution(
+                tool_name="MetaFillBookingFormTool",
+                params={
+                    "event_name": f"Room {self.room_number} Booking",
+                    "start_time": self.meta['start_time'],
+                    "end_time": self.meta['end_time'],
+                    "save_as_draft": True
+                },
+                response=fill_result,
+                environment=env,
+                header_summary=f"Filling and submitting booking form for room {self.room_number}"
+            )))
         return fill_result.success
 
     async def verify_success(self, environment=None) -> bool:
         # TODO: Implement verification of successful booking
         # Verify submission
         try:
-            # TODO: Implement real page checking
-            # Wait for text to appear
+            # Wait for text to appear; get_by_text rides Playwright's
+            # mutation-observer wait instead of re-reading the whole
+            # document text on a polling interval (and keeps the text out
+            # of an injected JS expression)
             expected_text = "Проект успешно создан."
-            await environment.page.wait_for_function(
-                f'document.body.textContent.includes("{expected_text}")',
-                timeout=5000
-            )
+            await environment.page.get_by_text(expected_text).wait_for(
+                timeout=5000)
             return True
 
         except Exception as e:
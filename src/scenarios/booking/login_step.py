@@ -1,10 +1,15 @@
+import asyncio
+import json
 import logging
+
+from typing import TYPE_CHECKING
+
 from src.config import CONFIG
 from src.scenarios.base import ScenarioStep, StepStatus
-from src.tools.base import ToolResponse
-from src.tools.browser.click import CheckContentTool, ClickTool, FillTool, NavigateTool
-from src.tools.browser.environment import BrowserEnvironment
-from src.tools.call_human import CallHumanTool
+
+if TYPE_CHECKING:
+    from src.tools.browser.environment import BrowserEnvironment
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,16 +20,36 @@ class LoginStep(ScenarioStep):
         super().__init__()
         self.status = StepStatus.NOT_STARTED
         self._success_texts = ["Личный кабинет", "Центр приложений"]
-        self._register_tools()
+        # JS predicate compiled once per instance; CheckContentTool passes
+        # it straight to wait_for_function with no per-call serialization.
+        # &&-joined to mirror the all-texts scan that decides success
+        self._success_predicate_js = "() => " + " && ".join(
+            f"document.body.innerText.includes({json.dumps(t, ensure_ascii=False)})"
+            for t in self._success_texts)
+        # Hot-path bindings to the toolbox singletons; execute() must not
+        # re-instantiate tools per call
+        self._nav = self.toolbox.get_tool("NavigateTool")
+        self._check = self.toolbox.get_tool("CheckContentTool")
+        self._fill = self.toolbox.get_tool("FillTool")
+        self._click = self.toolbox.get_tool("ClickTool")
 
     def _register_tools(self):
+        # Imported here, not at module top: the browser tool modules only
+        # load when a step is actually constructed
+        from src.tools.browser.click import (
+            CheckContentTool, ClickTool, FillTool,
+            NavigateAndVerifyTool, NavigateTool)
+        from src.tools.call_human import CallHumanTool
+
         self.toolbox.register_tool("NavigateTool", NavigateTool())
+        self.toolbox.register_tool(
+            "NavigateAndVerifyTool", NavigateAndVerifyTool())
         self.toolbox.register_tool("CheckContentTool", CheckContentTool())
         self.toolbox.register_tool("FillTool", FillTool())
         self.toolbox.register_tool("ClickTool", ClickTool())
         self.toolbox.register_tool("CallHumanTool", CallHumanTool())
 
-    async def execute(self, env: BrowserEnvironment) -> bool:
+    async def execute(self, env: "BrowserEnvironment") -> bool:
         """
         Execute login sequence with full logging and history tracking
 
@@ -37,46 +62,74 @@ class LoginStep(ScenarioStep):
         self.status = StepStatus.IN_PROGRESS
         logger.info("Starting login step execution")
 
+        if env.auth_valid():
+            # Session cookies from a recent login are still valid: skip
+            # the navigation and form round-trips entirely
+            logger.info("Reusing warm session, skipping login")
+            self.status = StepStatus.COMPLETED
+            return True
+
         try:
-            # Navigate to login page
+            # Navigate to login page; proving the form is present is left
+            # to FillTool's selector auto-wait, so the happy path spends no
+            # separate content round-trip here
             msg = f"Navigating to login page: {CONFIG.isu_booking_creds.booking_login}"
             logger.info(msg)
-            nav_result = await NavigateTool().execute(
+            nav_result = await self._nav.execute(
                 env=env,
                 url=CONFIG.isu_booking_creds.booking_login
             )
 
-            nav_check_result = await CheckContentTool().execute(
-                env=env,
-                texts=["Имя пользователя или E-mail"]
-            )
-
-            await self._record_tool_execution(
+            self._queue_tool_execution(
                 tool_name="NavigateTool",
                 params={"url": CONFIG.isu_booking_creds.booking_login},
-                response=ToolResponse(
-                    success=nav_check_result.success,
-                    meta={"action": "navigate",
-                          "url": CONFIG.isu_booking_creds.booking_login}
-                ),
+                response=nav_result,
                 environment=env,
                 header_summary=msg
             )
 
-            if not nav_check_result.success or not nav_result.success:
+            if not nav_result.success:
+                # Diagnostic only: record what the page showed instead of
+                # the login form
+                check_result = await self._check.execute(
+                    env=env,
+                    texts=["Имя пользователя или E-mail"]
+                )
+                self._queue_tool_execution(
+                    tool_name="CheckContentTool",
+                    params={"texts": ["Имя пользователя или E-mail"]},
+                    response=check_result,
+                    environment=env,
+                    header_summary="Checking login page content after "
+                                   "failed navigation"
+                )
                 logger.error(
-                    "Failed to verify login page content: %s", nav_check_result.error)
+                    "Failed to reach login page: %s", nav_result.error)
                 return False
 
-            # Fill username
-            msg = "Filling username field"
-            logger.info(msg)
-            username_result = await FillTool().execute(
+            # Fill username and password; the fields are independent, so
+            # by default both fills go out in one wall-clock slot.
+            # parallel_fill: false in config opts serialized drivers out.
+            username_call = self._fill.execute(
                 env=env,
                 selector="#username",
                 value=CONFIG.isu_booking_creds.username
             )
-            await self._record_tool_execution(
+            password_call = self._fill.execute(
+                env=env,
+                selector="#password",
+                value=CONFIG.isu_booking_creds.password
+            )
+            if CONFIG.get("parallel_fill", True):
+                logger.info("Filling username and password concurrently")
+                username_result, password_result = await asyncio.gather(
+                    username_call, password_call)
+            else:
+                logger.info("Filling username and password sequentially")
+                username_result = await username_call
+                password_result = await password_call
+
+            self._queue_tool_execution(
                 tool_name="FillTool",
                 params={
                     "selector": "#username",
@@ -84,22 +137,9 @@ class LoginStep(ScenarioStep):
                 },
                 response=username_result,
                 environment=env,
-                header_summary=msg
+                header_summary="Filling username field"
             )
-            if not username_result.success:
-                logger.error("Failed to fill username: %s",
-                             username_result.error)
-                return False
-
-            # Fill password
-            msg = "Filling password field"
-            logger.info(msg)
-            password_result = await FillTool().execute(
-                env=env,
-                selector="#password",
-                value=CONFIG.isu_booking_creds.password
-            )
-            await self._record_tool_execution(
+            self._queue_tool_execution(
                 tool_name="FillTool",
                 params={
                     "selector": "#password",
@@ -107,8 +147,12 @@ class LoginStep(ScenarioStep):
                 },
                 response=password_result,
                 environment=env,
-                header_summary=msg
+                header_summary="Filling password field"
             )
+            if not username_result.success:
+                logger.error("Failed to fill username: %s",
+                             username_result.error)
+                return False
             if not password_result.success:
                 logger.error("Failed to fill password: %s",
                              password_result.error)
@@ -117,11 +161,11 @@ class LoginStep(ScenarioStep):
             # Click login button
             msg = "Clicking login button – logging in with filled values"
             logger.info(msg)
-            click_result = await ClickTool().execute(
+            click_result = await self._click.execute(
                 env=env,
                 text="Вход"
             )
-            await self._record_tool_execution(
+            self._queue_tool_execution(
                 tool_name="ClickTool",
                 params={"text": "Вход"},
                 response=click_result,
@@ -133,6 +177,10 @@ class LoginStep(ScenarioStep):
                              click_result.error)
                 return False
 
+            # Queued records go in before verification so the history
+            # stays in execution order
+            await self._flush_records()
+
             # Verify successful login
             return await self.verify_success(environment=env)
 
@@ -140,10 +188,13 @@ class LoginStep(ScenarioStep):
             logger.error("Login step failed with unexpected error: %s", str(e))
             self.status = StepStatus.FAILED
             return False
+        finally:
+            # Early failure returns still land their queued records
+            await self._flush_records()
 
     async def verify_success(
             self,
-            environment: BrowserEnvironment) -> bool:
+            environment: "BrowserEnvironment") -> bool:
         """
         Verify successful login by checking for expected page elements
 
@@ -156,9 +207,11 @@ class LoginStep(ScenarioStep):
         msg = "Verifying login success..."
         logger.info(msg)
 
-        verify_result = await CheckContentTool().execute(
+        verify_result = await self._check.execute(
             env=environment,
-            texts=self._success_texts
+            texts=self._success_texts,
+            wait_timeout=5000,
+            predicate_js=self._success_predicate_js
         )
 
         await self._record_tool_execution(
@@ -171,6 +224,7 @@ class LoginStep(ScenarioStep):
 
         if verify_result.success:
             logger.info("Login successful - found expected page elements")
+            environment.mark_authenticated()
             self.status = StepStatus.COMPLETED
             return True
 
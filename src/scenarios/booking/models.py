@@ -0,0 +1,119 @@
+"""Canonical booking parameter model and parse prompt.
+
+Kept in one module so pydantic compiles the BookingParams core schema a
+single time, regardless of how many scenario modules import it.
+"""
+from datetime import datetime, time
+from typing import Annotated
+
+from pydantic import BaseModel, Field, field_validator
+from pydantic.functional_validators import BeforeValidator
+
+from config import CONFIG
+from tools.date import next_thursday
+
+default_booking_params = CONFIG.default_booking_params
+
+
+def _parse_ddmmyyyy(value: str) -> datetime:
+    """Parse DD-MM-YYYY via the C-level fromisoformat fast path"""
+    day, month, year = value.split("-")
+    return datetime.fromisoformat(f"{year}-{month}-{day}")
+
+
+DateFormatConvert = Annotated[
+    datetime,
+    BeforeValidator(lambda x: _parse_ddmmyyyy(x) if isinstance(x, str) else x)
+]
+TimeFormatConvert = Annotated[
+    time,
+    BeforeValidator(lambda x: time.fromisoformat(x)
+                    if isinstance(x, str) else x)
+]
+
+# Config-derived defaults parsed once at import instead of per model class
+# evaluation; fromisoformat skips strptime's format-string machinery
+_DEFAULT_START_TIME = time.fromisoformat(default_booking_params.start_time)
+_DEFAULT_END_TIME = time.fromisoformat(default_booking_params.end_time)
+
+
+class BookingParams(BaseModel):
+    room_count: int = Field(description="Number of rooms to book")
+    room_numbers: list[str] | None = Field(
+        description="List of preferred room numbers if specified", default=None)
+    event_name: str = Field(
+        description="Name of the event",
+        default=default_booking_params.event_name)
+    date: DateFormatConvert = Field(
+        description="Calculated booking date in DD-MM-YYYY   format",
+        # default_factory, not default: a default= would freeze "next
+        # Thursday" to whenever this module was imported
+        default_factory=next_thursday)
+    start_time: TimeFormatConvert = Field(
+        description="Start time of booking in HH:MM format",
+        default=_DEFAULT_START_TIME)
+    end_time: TimeFormatConvert = Field(
+        description="End time of booking in HH:MM format",
+        default=_DEFAULT_END_TIME)
+    building: str = Field(
+        description="Building name if specified",
+        default=default_booking_params.building)
+
+    @field_validator("event_name", "date", "start_time", "end_time",
+                     "building", mode="before")
+    @classmethod
+    def _default_when_none(cls, value, info):
+        """Substitute the field default for explicit nulls.
+
+        The parse LLM returns null for anything the command left out, so
+        callers can validate its output as-is without filtering None
+        entries first.
+        """
+        if value is not None:
+            return value
+        field = cls.model_fields[info.field_name]
+        if field.default_factory is not None:
+            return field.default_factory()
+        return field.default
+
+
+# Build the core schema at import time so the first user request does not
+# pay pydantic's one-off compilation cost
+BookingParams.model_rebuild()
+
+
+# Static instructions and examples come first so every call shares a
+# byte-identical prefix; only the trailing date/command block varies.
+# Providers' prompt caches key on exact prefix match.
+PARSE_BOOKING_PROMPT = """Parse the booking command and extract parameters.
+
+Return a JSON with this structure:
+{{
+    "room_count": int,
+    "room_numbers": [str] | null, # Extract room number mentions from the command, the number of mentions can be different from room count, if no mentions - null
+    "event_name": str \ null,
+    "date": "DD-MM-YYYY" | null, # You should calculate this based on the current date
+    "start_time": "HH:MM" | null,
+    "end_time": "HH:MM" | null,
+    "building": string | null
+}}
+
+Return only valid JSON without comments or explanations.
+
+Example input:
+Current date: 07 January 2025, Tuesday
+Command: "забронируй 3 аудитории на следующий четверг с 6 до 10 вечера на кронверкском проспекте, особенно 1405"
+
+Example output:
+{{
+    "room_count": 3,
+    "room_numbers": ["1405"],
+    "event_name": null,
+    "date": 09-01-2025",
+    "start_time": "18:00",
+    "end_time": "22:00",
+    "building": "Кронверкский проспект"
+}}
+
+Current date: {current_date}
+Command: {user_command}"""
@@ -1,4 +1,6 @@
+import json
 import logging
+
 from src.config import CONFIG
 from src.scenarios.base import ScenarioStep, StepStatus
 from src.tools.browser.click import CheckContentTool, ClickTool, NavigateTool
@@ -20,7 +22,17 @@ class NavigateToBookingStep(ScenarioStep):
             "Картотека заявок",
             "Проект заявки"
         ]
-        self._register_tools()
+        # JS predicate compiled once per instance; CheckContentTool passes
+        # it straight to wait_for_function with no per-call serialization.
+        # &&-joined to mirror the all-texts scan that decides success
+        self._success_predicate_js = "() => " + " && ".join(
+            f"document.body.innerText.includes({json.dumps(t, ensure_ascii=False)})"
+            for t in self._success_texts)
+        # Hot-path bindings to the toolbox singletons; execute() must not
+        # re-instantiate tools per call
+        self._nav = self.toolbox.get_tool("NavigateTool")
+        self._click = self.toolbox.get_tool("ClickTool")
+        self._check = self.toolbox.get_tool("CheckContentTool")
 
     def _register_tools(self):
         """Register required tools for navigation and verification"""
@@ -45,11 +57,11 @@ class NavigateToBookingStep(ScenarioStep):
             # Navigate to booking page
             msg = f"Navigating to booking page: {CONFIG.isu_booking_creds.booking_url}"
             logger.info(msg)
-            nav_result = await NavigateTool().execute(
+            nav_result = await self._nav.execute(
                 env=env,
                 url=CONFIG.isu_booking_creds.booking_url
             )
-            await self._record_tool_execution(
+            self._queue_tool_execution(
                 tool_name="NavigateTool",
                 params={"url": CONFIG.isu_booking_creds.booking_url},
                 response=nav_result,
@@ -65,11 +77,11 @@ class NavigateToBookingStep(ScenarioStep):
             # Click "Create booking" button
             msg = "Clicking 'Create booking' button"
             logger.info(msg)
-            click_result = await ClickTool().execute(
+            click_result = await self._click.execute(
                 env=env,
                 text="Создать заявку"
             )
-            await self._record_tool_execution(
+            self._queue_tool_execution(
                 tool_name="ClickTool",
                 params={"text": "Создать заявку"},
                 response=click_result,
@@ -82,6 +94,10 @@ class NavigateToBookingStep(ScenarioStep):
                     "Failed to click 'Create booking' button: %s", click_result.error)
                 return False
 
+            # Queued records go in before verification so the history
+            # stays in execution order
+            await self._flush_records()
+
             # Verify successful navigation
             return await self.verify_success(environment=env)
 
@@ -90,6 +106,9 @@ class NavigateToBookingStep(ScenarioStep):
                 "Navigation step failed with unexpected error: %s", str(e))
             self.status = StepStatus.FAILED
             return False
+        finally:
+            # Early failure returns still land their queued records
+            await self._flush_records()
 
     async def verify_success(self, environment: BrowserEnvironment) -> bool:
         """
@@ -104,9 +123,11 @@ class NavigateToBookingStep(ScenarioStep):
         msg = "Verifying successful navigation to booking page"
         logger.info(msg)
 
-        verify_result = await CheckContentTool().execute(
+        verify_result = await self._check.execute(
             env=environment,
-            texts=self._success_texts
+            texts=self._success_texts,
+            wait_timeout=5000,
+            predicate_js=self._success_predicate_js
         )
 
         await self._record_tool_execution(
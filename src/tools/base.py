@@ -12,6 +12,10 @@ logger = logging.getLogger(__name__)
 
 
 class Tool(ABC):
+    # Whether concurrent executions of this tool are safe. Only tools that
+    # purely read state should set this; mutating tools stay serial.
+    parallel_safe = False
+
     @abstractmethod
     def execute(self, **kwargs) -> Any:
         pass
@@ -75,15 +79,30 @@ class ToolExecutionRecord:
     response: ToolResponse
     header_summary: str | None = None
     env_params: dict | None = None
+    # Rendered full-detail history text; records are immutable once
+    # created, so the first render is reused on every later call
+    _text_cache: str | None = None
 
-    def to_history_text(self) -> str:
+    def to_history_text(self, include_env_state: bool = True) -> str:
         """
         Convert tool execution record to human-readable format for LLM analysis.
         Successful executions are summarized briefly while failures include more detail.
 
+        Args:
+            include_env_state: Whether to render the captured environment
+                state for failures. Callers pass False for older records so
+                only the newest failure carries the expensive DOM snapshot.
+
         Returns:
             str: Formatted history text suitable for LLM analysis
         """
+        if include_env_state:
+            if self._text_cache is None:
+                self._text_cache = self._render_history_text(True)
+            return self._text_cache
+        return self._render_history_text(False)
+
+    def _render_history_text(self, include_env_state: bool) -> str:
         timestamp_str = self.timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
         # Clean sensitive data from params
@@ -142,10 +161,15 @@ class ToolExecutionRecord:
             if self.env_params is None:
                 return "\n\n".join(sections)
 
-            error_details.append("State at failure:")
-            for key, value in self.env_params.items():
-                if value is not None:
-                    error_details.append(f"  - {key}: {value}")
+            if include_env_state:
+                error_details.append("State at failure:")
+                for key, value in self.env_params.items():
+                    if value is not None:
+                        error_details.append(f"  - {key}: {value}")
+            else:
+                error_details.append(
+                    "State at failure: <elided, page was "
+                    f"{self.env_params.get('env_address')}>")
 
             if error_details:
                 sections.append("\n".join(error_details))
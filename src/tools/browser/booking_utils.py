@@ -26,6 +26,8 @@ UNIVERSITY_INTERVALS = {
 class GetTimeIntervalsTool(Tool):
     """Tool for mapping start and end times to university time interval numbers."""
 
+    parallel_safe = True
+
     def execute(self,
                 start_time: time | str,
                 end_time: time | str) -> ToolResponse:
@@ -96,6 +98,8 @@ class GetTimeIntervalsTool(Tool):
 class GetRoomIdTool(BrowserTool):
     """Tool for extracting room_id from page content."""
 
+    parallel_safe = True
+
     async def execute(self,
                       env: BrowserEnvironment,
                       room_number: str) -> ToolResponse:
@@ -165,6 +169,8 @@ class GetRoomIdTool(BrowserTool):
 class GetAvailableRoomsTool(BrowserTool):
     """Tool for getting list of available rooms from schedule table."""
 
+    parallel_safe = True
+
     async def execute(self, env: BrowserEnvironment) -> ToolResponse:
         """
         Get list of rooms that have available slots.
@@ -222,6 +228,8 @@ class GetAvailableRoomsTool(BrowserTool):
 class CheckRoomAvailableTool(Tool):
     """Tool for checking if room is available during specified intervals."""
 
+    parallel_safe = True
+
     async def execute(
         self,
         env: BrowserEnvironment,
@@ -185,11 +185,16 @@ class FillTool(BrowserTool):
 class CheckContentTool(BrowserTool):
     """Tool for checking if text exists in page content"""
 
+    parallel_safe = True
+
     async def execute(
         self,
         env: BrowserEnvironment,
         texts: list[str],
-        timeout: int = TIMEOUT
+        timeout: int = TIMEOUT,
+        wait_timeout: int | None = None,
+        mode: str = "all",
+        predicate_js: str | None = None
     ) -> ToolResponse:
         """Check if texts are present in page content
 
@@ -200,6 +205,16 @@ class CheckContentTool(BrowserTool):
             List of text strings to find
         timeout : int, optional
             Maximum wait time in ms
+        wait_timeout : int | None, optional
+            When set, wait up to this many ms for the texts to appear via
+            a renderer-side mutation wait before scanning; None keeps the
+            original immediate single scan
+        mode : str, optional
+            "all" waits for every text, "any" for at least one,
+            by default "all"
+        predicate_js : str | None, optional
+            Pre-built JS predicate to wait on instead of constructing one
+            from texts per call; only used together with wait_timeout
         """
         meta = {
             "action": "check_content",
@@ -209,6 +224,27 @@ class CheckContentTool(BrowserTool):
         }
 
         try:
+            if wait_timeout is not None:
+                quantifier = "every" if mode == "all" else "some"
+                try:
+                    # Event-driven: fires on DOM mutation inside the
+                    # renderer instead of cross-process polling
+                    if predicate_js is not None:
+                        await env.page.wait_for_function(
+                            predicate_js, timeout=wait_timeout)
+                    else:
+                        await env.page.wait_for_function(
+                            "texts => texts.%s("
+                            "t => document.body.innerText.includes(t))"
+                            % quantifier,
+                            arg=list(texts),
+                            timeout=wait_timeout
+                        )
+                except Exception:
+                    # Fall through: the scan below reports what is missing
+                    meta["narrative"].append(
+                        f"Texts did not appear within {wait_timeout}ms")
+
             content = await env.page.content()
             found_texts = []
             missing_texts = []
@@ -251,6 +287,84 @@ class CheckContentTool(BrowserTool):
         return """Playwright tool. Check if texts exist in page content.
         Parameters:
         texts: List[str] - List of text strings to look for in the page content
+        wait_timeout: int | None - optionally wait this many ms for the texts to appear
+        """
+
+
+class NavigateAndVerifyTool(BrowserTool):
+    """Tool fusing navigation with a content-appearance check"""
+
+    async def execute(
+        self,
+        env: BrowserEnvironment,
+        url: str,
+        texts: list[str],
+        timeout: int = TIMEOUT
+    ) -> ToolResponse:
+        """Navigate to URL and wait for any expected text to appear
+
+        One round-trip to the browser instead of a goto followed by a
+        separate content check; the text wait runs inside the renderer
+        and fires on DOM mutation.
+
+        Parameters
+        ----------
+        env : BrowserEnvironment
+        url : str
+            URL to navigate to
+        texts : list[str]
+            Texts of which at least one must appear on the target page
+        timeout : int, optional
+            Maximum wait time in ms
+        """
+        meta = {
+            "action": "navigate_and_verify",
+            "url": url,
+            "texts": texts,
+            "narrative": []
+        }
+
+        try:
+            msg = f"Attempting to navigate to {url}"
+            meta["narrative"].append(msg)
+            logger.info(msg)
+
+            await env.page.goto(url, timeout=timeout)
+
+            msg = f"Waiting for any of the expected texts: {texts}"
+            meta["narrative"].append(msg)
+            logger.info(msg)
+
+            await env.page.wait_for_function(
+                "texts => texts.some(t => document.body.innerText.includes(t))",
+                arg=list(texts),
+                timeout=timeout
+            )
+
+            msg = f"Navigation successful to {url}, expected content present"
+            meta["narrative"].append(msg)
+            logger.info(msg)
+
+            return ToolResponse(
+                success=True,
+                meta=meta
+            )
+
+        except Exception as e:
+            error_msg = f"Navigate-and-verify failed for {url}: {str(e)}"
+            meta["narrative"].append(error_msg)
+            logger.error(error_msg)
+            return ToolResponse(
+                success=False,
+                error=error_msg,
+                meta=meta
+            )
+
+    def description(self):
+        return """Playwright tool. Navigate to URL and wait until any of the expected texts appears.
+        Parameters:
+        url: str - URL to navigate to
+        texts: List[str] - text strings, at least one must appear on the page
         """
 
 
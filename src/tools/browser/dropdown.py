@@ -111,6 +111,8 @@ class DropDownTool(BrowserTool):
 class DropdownOptionsTool(BrowserTool):
     """Tool for extracting options from a dropdown/select element"""
 
+    parallel_safe = True
+
     async def execute(
         self,
         env: BrowserEnvironment,
@@ -1,15 +1,21 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, TYPE_CHECKING
 import logging
+import time
 from datetime import datetime
 from dataclasses import dataclass
 from bs4 import BeautifulSoup
-from playwright.async_api import (
-    async_playwright, Browser, Page,
-    BrowserContext, Request, Response
-)
 from config import CONFIG
 
+if TYPE_CHECKING:
+    # playwright's import tree is heavy; it is only loaded for real when
+    # a browser is actually started in initialize()
+    from playwright.async_api import (
+        Browser, Page, BrowserContext, Request, Response
+    )
+
 TIMEOUT = CONFIG.isu_booking_creds.page_interaction_timeout
 logger = logging.getLogger(__name__)
 
@@ -23,6 +29,18 @@ class RequestResponsePair:
     timestamp: datetime = datetime.now()
 
 
+@dataclass
+class EnvSnapshot:
+    """Point-in-time environment observation.
+
+    Fetched once after a tool execution and shared by every consumer of
+    that moment's state (execution record, snapshot debounce), instead of
+    each of them probing the environment separately.
+    """
+    address: str
+    state: str
+
+
 class Environment(ABC):
     @abstractmethod
     def current_state_address(self) -> str:
@@ -34,6 +52,11 @@ class Environment(ABC):
         """Get a concise description of the environment state"""
         pass
 
+    async def snapshot(self) -> EnvSnapshot:
+        """Capture address and state description in one probe"""
+        return EnvSnapshot(address=self.current_state_address(),
+                           state=await self.describe_state())
+
 
 class BrowserEnvironment(Environment):
     """
@@ -51,6 +74,13 @@ class BrowserEnvironment(Environment):
     _request_order: List[str] = []
     _max_entries: int = 1000
 
+    # Monotonic deadline until which the session cookies in the browser
+    # context are assumed valid; 0.0 means not authenticated
+    _auth_expiry: float = 0.0
+    # Conservative default: ISU sessions outlive this comfortably, and an
+    # expired cookie only costs one extra login
+    AUTH_TTL_SECONDS: int = 300
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super(BrowserEnvironment, cls).__new__(cls)
@@ -60,6 +90,7 @@ class BrowserEnvironment(Environment):
         """Initialize browser environment if not already running"""
         if not self._browser:
             logger.debug("Starting new browser environment")
+            from playwright.async_api import async_playwright
             playwright = await async_playwright().start()
             self._browser = await playwright.chromium.launch(
                 headless=True,
@@ -78,6 +109,15 @@ class BrowserEnvironment(Environment):
     def current_state_address(self):
         return self.page.url if self._page else ""
 
+    def mark_authenticated(self, ttl: float | None = None) -> None:
+        """Record that the context holds a fresh login session"""
+        self._auth_expiry = time.monotonic() + (
+            self.AUTH_TTL_SECONDS if ttl is None else ttl)
+
+    def auth_valid(self) -> bool:
+        """Whether the last recorded login is still within its TTL"""
+        return time.monotonic() < self._auth_expiry
+
     def _setup_tracking(self) -> None:
         """Set up event listeners for request/response tracking"""
         if not self._page:
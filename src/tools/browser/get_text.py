@@ -13,6 +13,8 @@ TIMEOUT = CONFIG.isu_booking_creds.page_interaction_timeout
 class GetTextTool(BrowserTool):
     """Tool for getting text content of elements by selector or role"""
 
+    parallel_safe = True
+
     async def execute(
         self,
         env: BrowserEnvironment,
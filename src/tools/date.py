@@ -4,6 +4,8 @@ import locale
 
 
 class CurrentDateTool(Tool):
+    parallel_safe = True
+
     # def __init__(self):
     # Set locale for Russian month/day names
     # locale.setlocale(locale.LC_TIME, 'ru_RU.UTF-8')
@@ -1,5 +1,9 @@
+from datetime import time
+
 import pytest
+from src.config import CONFIG
 from src.scenarios.booking.booking import BookingScenario
+from src.scenarios.booking.models import BookingParams
 from src.planner import ProxyPlanner
 
 
@@ -21,6 +25,36 @@ class TestBookingScenario:
         assert score == expected_score
 
 
+class TestBookingParams:
+    def test_null_date_falls_back_to_next_thursday(self):
+        params = BookingParams.model_validate(
+            {"room_count": 1, "date": None})
+        assert params.date.weekday() == 3
+
+    def test_null_times_fall_back_to_config_defaults(self):
+        params = BookingParams.model_validate(
+            {"room_count": 1, "start_time": None, "end_time": None})
+        defaults = CONFIG.default_booking_params
+        assert params.start_time == time.fromisoformat(defaults.start_time)
+        assert params.end_time == time.fromisoformat(defaults.end_time)
+
+    def test_null_event_name_and_building_fall_back_to_config_defaults(self):
+        params = BookingParams.model_validate(
+            {"room_count": 1, "event_name": None, "building": None})
+        defaults = CONFIG.default_booking_params
+        assert params.event_name == defaults.event_name
+        assert params.building == defaults.building
+
+    def test_explicit_values_are_kept(self):
+        params = BookingParams.model_validate(
+            {"room_count": 2, "date": "05-03-2026",
+             "start_time": "10:00", "end_time": "12:00"})
+        assert params.date.day == 5
+        assert params.date.month == 3
+        assert params.start_time == time(10, 0)
+        assert params.end_time == time(12, 0)
+
+
 class TestProxyPlanner:
     @pytest.fixture
     def planner(self):
@@ -0,0 +1,79 @@
+import pytest
+from unittest.mock import patch
+from src.llm_cache import CachedLLMInterface
+
+
+@pytest.fixture
+def mock_response():
+    return {
+        'model': 'mistral/mistral-large-latest',
+        'choices': [{
+            'index': 0,
+            'message': {'content': 'cached answer', 'role': 'assistant'}
+        }],
+        'usage': {'completion_tokens': 2, 'prompt_tokens': 2, 'total_tokens': 4}
+    }
+
+
+@pytest.fixture
+def llm():
+    return CachedLLMInterface(
+        model_name="mistral/mistral-large-latest",
+        llm_api_key="test_key",
+        llm_base_url=None
+    )
+
+
+@patch('litellm.completion')
+def test_identical_request_hits_cache(mock_completion, llm, mock_response):
+    mock_completion.return_value = mock_response
+
+    first = llm.send_request(prompt="Who are you?")
+    second = llm.send_request(prompt="Who are you?")
+
+    mock_completion.assert_called_once()
+    assert first is second
+    assert llm.stats == {"hits": 1, "misses": 1}
+
+
+@patch('litellm.completion')
+def test_different_prompts_miss_cache(mock_completion, llm, mock_response):
+    mock_completion.return_value = mock_response
+
+    llm.send_request(prompt="first")
+    llm.send_request(prompt="second")
+
+    assert mock_completion.call_count == 2
+    assert llm.stats == {"hits": 0, "misses": 2}
+
+
+@patch('litellm.completion')
+def test_sampled_requests_bypass_cache(mock_completion, llm, mock_response):
+    mock_completion.return_value = mock_response
+
+    llm.send_request(prompt="same", temperature=0.7)
+    llm.send_request(prompt="same", temperature=0.7)
+
+    assert mock_completion.call_count == 2
+    assert llm.stats == {"hits": 0, "misses": 0}
+
+
+def test_disk_cache_roundtrip(tmp_path):
+    from src.llm_cache import DiskResponseCache
+
+    cache = DiskResponseCache(cache_dir=tmp_path / "cache")
+    key = DiskResponseCache.key_for("rendered prompt")
+
+    assert cache.get(key) is None
+    cache.set(key, {"analysis": "ok"})
+    assert cache.get(key) == {"analysis": "ok"}
+
+
+def test_disk_cache_expiry(tmp_path):
+    from src.llm_cache import DiskResponseCache
+
+    cache = DiskResponseCache(cache_dir=tmp_path / "cache", ttl=-1)
+    key = DiskResponseCache.key_for("rendered prompt")
+
+    cache.set(key, {"analysis": "ok"})
+    assert cache.get(key) is None